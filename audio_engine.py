@@ -5,14 +5,67 @@ Core audio capture and transcription engine using Deepgram WebSocket API.
 """
 
 import asyncio
+import collections
 import json
-import numpy as np
-import sounddevice as sd
-import websockets
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 from config import AudioConfig, DeepgramConfig, OutputConfig
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to stdlib
+    _json_loads = json.loads
+
+# sounddevice (and the NumPy/PortAudio libraries behind it) and websockets
+# are imported where first used, so the GUI starts without loading them.
+if TYPE_CHECKING:
+    import numpy as np
+
+# Deepgram sends many interim frames with an empty transcript; these can be
+# recognised without parsing the whole message.
+_EMPTY_TRANSCRIPT = b'"transcript":""'
+
+# Control messages. These must go out as text frames: Deepgram treats
+# binary frames as audio, so they stay str rather than bytes.
+# KeepAlive is needed because Deepgram closes streams that go quiet.
+_KEEPALIVE_MESSAGE = '{"type": "KeepAlive"}'
+_CLOSE_STREAM_MESSAGE = '{"type": "CloseStream"}'
+
+# Console prefixes for the hot transcript handlers
+_INTERIM_PREFIX = "\033[90m[interim] "
+_FINAL_PREFIX = "\033[92m[final]\033[0m "
+_ANSI_RESET = "\033[0m"
+
+_last_timestamp = (-1, "", "")  # (epoch second, format, formatted string)
+
+
+def content_timestamp(fmt: Optional[str] = None) -> str:
+    """Format the current time with CONTENT_TIME_FORMAT (or fmt), cached per second."""
+    global _last_timestamp
+    now = int(time.time())
+    if fmt is None:
+        fmt = OutputConfig.CONTENT_TIME_FORMAT
+    if now != _last_timestamp[0] or fmt != _last_timestamp[1]:
+        _last_timestamp = (now, fmt, datetime.fromtimestamp(now).strftime(fmt))
+    return _last_timestamp[2]
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop for the engine, using uvloop (or winloop on Windows) when available."""
+    try:
+        import uvloop as fast_loop
+    except ImportError:
+        try:
+            import winloop as fast_loop  # uvloop port for Windows
+        except ImportError:
+            return asyncio.new_event_loop()
+    return fast_loop.new_event_loop()
+
 
 class TranscriptionEngine:
     """
@@ -45,12 +98,26 @@ class TranscriptionEngine:
         
         self._is_running = False
         self._websocket = None  # websockets.ClientConnection
-        self._audio_queue: asyncio.Queue = asyncio.Queue()
+        self._last_send_time = 0.0  # time.monotonic() of the last frame sent
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Bounded ring buffer fed from the PortAudio thread (drops oldest on overflow)
+        self._audio_buf: collections.deque = collections.deque(maxlen=AudioConfig.AUDIO_BUFFER_BLOCKS)
+        self._overflow_blocks = 0  # Blocks overwritten since the last report
+        self._audio_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
         self._tasks: list[asyncio.Task] = []
         
         # Output file handling
         self._output_file: Optional[str] = None
+        self._output_fp = None  # Kept open for the whole session
+        self._writer: Optional[ThreadPoolExecutor] = None  # Single thread keeps write order
+        self._snapshot_output_config()
         
+    def _snapshot_output_config(self) -> None:
+        """Copy output settings read on every final into instance attributes."""
+        self._include_timestamps = OutputConfig.INCLUDE_TIMESTAMPS
+        self._content_time_format = OutputConfig.CONTENT_TIME_FORMAT
+    
     @property
     def is_running(self) -> bool:
         """Check if the engine is currently running."""
@@ -62,18 +129,19 @@ class TranscriptionEngine:
     
     def _default_interim_handler(self, text: str) -> None:
         """Default handler for interim results - print in gray."""
-        print(f"\033[90m[interim] {text}\033[0m", end="\r")
+        print(_INTERIM_PREFIX + text + _ANSI_RESET, end="\r")
     
     def _default_final_handler(self, text: str) -> None:
         """Default handler for final results - print and save."""
-        timestamp = datetime.now().strftime(OutputConfig.CONTENT_TIME_FORMAT)
-        if OutputConfig.INCLUDE_TIMESTAMPS:
-            print(f"\033[92m[final]\033[0m {timestamp} {text}")
+        timestamp = content_timestamp(self._content_time_format)
+        # One unflushed write per final; stdout is flushed on stop()
+        if self._include_timestamps:
+            sys.stdout.write(f"{_FINAL_PREFIX}{timestamp} {text}\n")
         else:
-            print(f"\033[92m[final]\033[0m {text}")
+            sys.stdout.write(f"{_FINAL_PREFIX}{text}\n")
         
-        # Write to file
-        self._write_to_file(text, timestamp)
+        # Write to file off the event loop
+        self._submit_write(text, timestamp)
     
     def _default_error_handler(self, error: Exception) -> None:
         """Default error handler."""
@@ -91,12 +159,17 @@ class TranscriptionEngine:
         filename = f"{OutputConfig.FILE_PREFIX}_{timestamp}{OutputConfig.FILE_EXTENSION}"
         filepath = OutputConfig.OUTPUT_DIR / filename
         
-        # Write header
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"# EchoLog 听写记录\n")
-            f.write(f"> 创建时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
+        # Write header and keep the handle open for subsequent appends.
+        # Binary mode with pre-encoded UTF-8 skips the TextIOWrapper codec.
+        self._close_output_file()
+        header = OutputConfig.HEADER_TEMPLATE.format(
+            created=datetime.now().strftime(OutputConfig.HEADER_TIME_FORMAT)
+        )
+        f = open(filepath, "wb", buffering=65536)
+        f.write(header.encode("utf-8"))
+        f.flush()
         
+        self._output_fp = f
         self._output_file = str(filepath)
         print(f"\033[94m[info] 输出文件: {filepath}\033[0m")
         return self._output_file
@@ -107,34 +180,128 @@ class TranscriptionEngine:
             return
         
         try:
-            with open(self._output_file, "a", encoding="utf-8") as f:
-                if OutputConfig.INCLUDE_TIMESTAMPS:
-                    f.write(f"{timestamp} {text}\n\n")
-                else:
-                    f.write(f"{text}\n\n")
+            if self._output_fp is None:
+                self._output_fp = open(self._output_file, "ab", buffering=65536)
+            
+            if self._include_timestamps:
+                self._output_fp.write(f"{timestamp} {text}\n\n".encode("utf-8"))
+            else:
+                self._output_fp.write(f"{text}\n\n".encode("utf-8"))
+            self._output_fp.flush()
         except Exception as e:
             self._on_error(e)
     
+    def _submit_write(self, text: str, timestamp: str) -> None:
+        """Queue a file write on the background writer thread."""
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="echolog-writer")
+        self._writer.submit(self._write_to_file, text, timestamp)
+    
+    def _shutdown_writer(self) -> None:
+        """Wait for pending file writes to finish."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+    
+    def _close_output_file(self) -> None:
+        """Close the session output file handle, if open."""
+        if self._output_fp is not None:
+            try:
+                self._output_fp.close()
+            except Exception:
+                pass
+            finally:
+                self._output_fp = None
+    
     # ========================================
     # Audio Capture
     # ========================================
     
-    def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
+    def _audio_callback(self, indata: "np.ndarray", frames: int, time_info, status) -> None:
         """Callback for sounddevice audio stream."""
         if status:
             print(f"\033[93m[audio warning] {status}\033[0m")
         
-        # Convert to bytes and put in queue
-        audio_data = indata.copy().tobytes()
+        # Single copy out of the PortAudio buffer (tobytes() already copies,
+        # so the extra .copy() was a wasted allocation)
+        buf = self._audio_buf
+        if len(buf) == buf.maxlen:
+            self._overflow_blocks += 1  # append() evicts the oldest block
+        buf.append(bytes(indata))
         
         try:
-            self._audio_queue.put_nowait(audio_data)
-        except asyncio.QueueFull:
-            pass  # Drop frames if queue is full
+            self._loop.call_soon_threadsafe(self._audio_event.set)
+        except (AttributeError, RuntimeError):
+            pass  # Loop not set or already closed
+    
+    def _reset_audio_buffer(self) -> None:
+        """Bind the buffer to the running loop and drop any stale audio."""
+        self._loop = asyncio.get_running_loop()
+        self._audio_buf.clear()
+        self._overflow_blocks = 0
+        self._audio_event.clear()
+    
+    async def _next_audio(self) -> bytes:
+        """
+        Wait for audio and coalesce buffered blocks into one chunk.
+        
+        Blocks are accumulated until SEND_BATCH_BYTES is reached or
+        SEND_BATCH_DELAY seconds have passed since the first block arrived.
+        """
+        buf = self._audio_buf
+        max_backlog = AudioConfig.MAX_BACKLOG_BLOCKS
+        batch_bytes = AudioConfig.SEND_BATCH_BYTES
+        batch_delay = AudioConfig.SEND_BATCH_DELAY
+        chunks = []
+        size = 0
+        deadline = 0.0
+        
+        while True:
+            self._audio_event.clear()
+            
+            # Sender fell behind realtime (slow network): drop the oldest
+            # half of the backlog so latency stays bounded. Blocks the ring
+            # buffer overwrote while a send was stalled are reported here too.
+            dropped = self._overflow_blocks
+            if dropped:
+                self._overflow_blocks = 0
+            backlog = len(buf)
+            if backlog > max_backlog:
+                for _ in range(backlog // 2):
+                    buf.popleft()
+                dropped += backlog // 2
+            if dropped:
+                print(f"\033[93m[warning] 音频积压，丢弃 {dropped} 个音频块\033[0m")
+            
+            while buf:
+                chunk = buf.popleft()
+                chunks.append(chunk)
+                size += len(chunk)
+            
+            if size >= batch_bytes:
+                break
+            
+            if not chunks:
+                await self._audio_event.wait()
+                continue
+            
+            if not deadline:
+                deadline = time.monotonic() + batch_delay
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._audio_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+        
+        return b"".join(chunks)
     
     async def _capture_audio(self) -> None:
-        """Capture audio from microphone and put into queue."""
-        loop = asyncio.get_event_loop()
+        """Capture audio from microphone into the ring buffer until stopped."""
+        import sounddevice as sd
+        
+        self._stop_event.clear()
         
         with sd.InputStream(
             samplerate=AudioConfig.SAMPLE_RATE,
@@ -145,9 +312,8 @@ class TranscriptionEngine:
         ):
             print(f"\033[94m[info] 麦克风已启动 (采样率: {AudioConfig.SAMPLE_RATE}Hz)\033[0m")
             
-            # Keep the stream running
-            while self._is_running:
-                await asyncio.sleep(0.1)
+            # Keep the stream running; stop() sets the event
+            await self._stop_event.wait()
     
     # ========================================
     # WebSocket Communication
@@ -157,40 +323,69 @@ class TranscriptionEngine:
         """Send audio data to Deepgram via WebSocket."""
         while self._is_running:
             try:
-                # Get audio data from queue
-                audio_data = await asyncio.wait_for(
-                    self._audio_queue.get(), 
-                    timeout=0.5
-                )
+                # Get all pending audio blocks in one send
+                audio_data = await self._next_audio()
                 
-                if self._websocket:
-                    try:
-                        await self._websocket.send(audio_data)
-                    except websockets.ConnectionClosed:
-                        break
+                if audio_data:
+                    await self._send_chunk(audio_data)
                     
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 if self._is_running:
                     self._on_error(e)
                 break
     
+    async def _send_chunk(self, audio_data: bytes) -> None:
+        """Send one audio chunk; dropped while the connection is re-opened."""
+        import websockets
+        
+        websocket = self._websocket
+        if not websocket:
+            return
+        
+        try:
+            await websocket.send(audio_data)
+            self._last_send_time = time.monotonic()
+        except websockets.ConnectionClosed:
+            pass  # _receive_transcription handles reconnection
+    
+    async def _keep_alive(self) -> None:
+        """Send Deepgram KeepAlive messages while no audio is flowing (e.g. paused)."""
+        import websockets
+        
+        interval = DeepgramConfig.KEEPALIVE_INTERVAL
+        while self._is_running:
+            await asyncio.sleep(interval)
+            
+            websocket = self._websocket
+            if websocket and time.monotonic() - self._last_send_time >= interval:
+                try:
+                    await websocket.send(_KEEPALIVE_MESSAGE)
+                    self._last_send_time = time.monotonic()
+                except websockets.ConnectionClosed:
+                    pass
+    
     async def _receive_transcription(self) -> None:
         """Receive transcription results from Deepgram."""
+        import websockets
+        
         while self._is_running:
             try:
                 if not self._websocket:
                     await asyncio.sleep(0.1)
                     continue
                 
-                message = await asyncio.wait_for(
-                    self._websocket.recv(),
-                    timeout=1.0
-                )
+                # Receive raw bytes: the JSON parser takes bytes directly,
+                # so decoding the text frame to str is wasted work.
+                # recv() is cancellable, so no timeout is needed; stop()
+                # cancels this task.
+                message = await self._websocket.recv(decode=False)
+                
+                # Skip empty results without a full parse
+                if _EMPTY_TRANSCRIPT in message:
+                    continue
                 
                 # Parse JSON response
-                data = json.loads(message)
+                data = _json_loads(message)
                 
                 # Extract transcription
                 if "channel" in data:
@@ -207,18 +402,22 @@ class TranscriptionEngine:
                             else:
                                 self._on_interim(transcript)
                 
-            except asyncio.TimeoutError:
-                continue
             except websockets.ConnectionClosed:
-                if self._is_running:
-                    print("\033[93m[warning] WebSocket 连接已关闭\033[0m")
-                break
+                if not self._is_running:
+                    break
+                print("\033[93m[warning] WebSocket 连接已关闭，正在重连...\033[0m")
+                if not await self._reconnect_websocket():
+                    if self._is_running:
+                        self._fail(Exception("重连失败，录音已停止"))
+                    break
             except Exception as e:
                 if self._is_running:
                     self._on_error(e)
     
     async def _connect_websocket(self) -> bool:
         """Connect to Deepgram WebSocket API."""
+        import websockets
+        
         try:
             ws_url = DeepgramConfig.get_ws_url()
             headers = {
@@ -231,9 +430,15 @@ class TranscriptionEngine:
                 ws_url,
                 additional_headers=headers,
                 ping_interval=20,
-                ping_timeout=10,
+                # Allow a pong to queue behind a full audio batch on a slow
+                # uplink before declaring the connection dead
+                ping_timeout=20,
+                # linear16 audio doesn't deflate; skip per-frame zlib work
+                compression=None,
             )
             
+            self._set_nodelay()
+            self._last_send_time = time.monotonic()
             print(f"\033[92m[success] Deepgram 连接成功!\033[0m")
             return True
             
@@ -241,12 +446,46 @@ class TranscriptionEngine:
             self._on_error(Exception(f"连接失败: {e}"))
             return False
     
+    def _set_nodelay(self) -> None:
+        """Disable Nagle so small audio frames are not held back by the kernel."""
+        # asyncio and uvloop already do this for TCP transports; setting it
+        # here keeps the guarantee independent of the loop implementation
+        sock = self._websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass  # Not a TCP socket (e.g. a proxy or test transport)
+    
+    async def _reconnect_websocket(self) -> bool:
+        """Re-open the Deepgram connection after an unexpected close."""
+        self._websocket = None
+        
+        for _ in range(DeepgramConfig.RECONNECT_ATTEMPTS):
+            if not self._is_running:
+                return False
+            if await self._connect_websocket():
+                return True
+            await asyncio.sleep(DeepgramConfig.RECONNECT_DELAY)
+        
+        return False
+    
+    def _fail(self, error: Exception) -> None:
+        """End the session after an unrecoverable error instead of capturing into the void."""
+        self._on_error(error)
+        self._on_status_change("error")
+        # Same signals stop() sends: the capture task exits and whoever is
+        # waiting on _stop_event calls stop(), which still tears down the tasks
+        self._is_running = False
+        self._stop_event.set()
+    
     async def _disconnect_websocket(self) -> None:
         """Disconnect from Deepgram WebSocket."""
         if self._websocket:
             try:
                 # Send close message
-                await self._websocket.send(json.dumps({"type": "CloseStream"}))
+                await self._websocket.send(_CLOSE_STREAM_MESSAGE)
                 await self._websocket.close()
             except Exception:
                 pass
@@ -270,6 +509,9 @@ class TranscriptionEngine:
         
         self._on_status_change("connecting")
         
+        # Settings may have changed since the engine was created
+        self._snapshot_output_config()
+        
         # Initialize output file
         self._init_output_file()
         
@@ -281,18 +523,15 @@ class TranscriptionEngine:
         self._is_running = True
         self._on_status_change("recording")
         
-        # Clear audio queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        # Clear audio buffer
+        self._reset_audio_buffer()
         
         # Start tasks
         self._tasks = [
             asyncio.create_task(self._capture_audio()),
             asyncio.create_task(self._send_audio()),
             asyncio.create_task(self._receive_transcription()),
+            asyncio.create_task(self._keep_alive()),
         ]
         
         print("\033[92m[success] 开始录音...\033[0m")
@@ -302,29 +541,38 @@ class TranscriptionEngine:
     
     async def stop(self) -> None:
         """Stop the transcription engine."""
-        if not self._is_running:
+        # After _fail() the engine is no longer running but its tasks,
+        # connection and output file still need tearing down
+        if not self._is_running and not self._tasks:
             return
+        failed = not self._is_running
         
         print("\n" + "-" * 50)
         print("\033[94m[info] 正在停止...\033[0m")
         
         self._is_running = False
-        self._on_status_change("stopping")
+        self._stop_event.set()
+        if not failed:
+            self._on_status_change("stopping")
         
-        # Cancel all tasks
+        # Cancel all tasks, then wait for them together so each one's
+        # teardown isn't serialized behind the previous
         for task in self._tasks:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        await asyncio.gather(*self._tasks, return_exceptions=True)
         
         self._tasks.clear()
         
         # Disconnect WebSocket
         await self._disconnect_websocket()
         
-        self._on_status_change("idle")
+        self._shutdown_writer()
+        self._close_output_file()
+        sys.stdout.flush()
+        
+        # Leave the "error" status from _fail() visible
+        if not failed:
+            self._on_status_change("idle")
         
         if self._output_file:
             print(f"\033[92m[success] 录音已保存至: {self._output_file}\033[0m")
@@ -66,20 +66,40 @@ class DeepgramConfig:
     INTERIM_RESULTS = True
     ENDPOINTING = 300  # milliseconds
     
+    # Connection upkeep
+    KEEPALIVE_INTERVAL = 8    # seconds without audio before sending KeepAlive
+    RECONNECT_ATTEMPTS = 3
+    RECONNECT_DELAY = 0.5     # seconds between reconnect attempts
+    
+    # Cached URL, keyed on the settings it was built from (MODEL and
+    # LANGUAGE can be changed at runtime from the settings page)
+    _cached_url_key = None
+    _cached_url = ""
+    
     @classmethod
     def get_ws_url(cls) -> str:
         """Build the WebSocket URL with query parameters"""
+        key = (
+            cls.WEBSOCKET_URL, cls.MODEL, cls.LANGUAGE, cls.PUNCTUATE,
+            cls.INTERIM_RESULTS, cls.ENDPOINTING,
+            AudioConfig.SAMPLE_RATE, AudioConfig.CHANNELS,
+        )
+        if key == cls._cached_url_key:
+            return cls._cached_url
+        
         params = [
             f"model={cls.MODEL}",
             f"language={cls.LANGUAGE}",
-            f"punctuate={str(cls.PUNCTUATE).lower()}",
-            f"interim_results={str(cls.INTERIM_RESULTS).lower()}",
+            f"punctuate={'true' if cls.PUNCTUATE else 'false'}",
+            f"interim_results={'true' if cls.INTERIM_RESULTS else 'false'}",
             f"endpointing={cls.ENDPOINTING}",
             "encoding=linear16",
             f"sample_rate={AudioConfig.SAMPLE_RATE}",
             f"channels={AudioConfig.CHANNELS}",
         ]
-        return f"{cls.WEBSOCKET_URL}?{'&'.join(params)}"
+        cls._cached_url = f"{cls.WEBSOCKET_URL}?{'&'.join(params)}"
+        cls._cached_url_key = key
+        return cls._cached_url
 
 
 # ========================================
@@ -92,6 +112,12 @@ class AudioConfig:
     DTYPE = "int16"          # Linear16 format
     BLOCK_SIZE = 4000        # Samples per block (~250ms at 16kHz)
     
+    # Send batching (coalesce blocks into fewer WebSocket frames)
+    SEND_BATCH_BYTES = 32000  # ~1s of audio at 16kHz int16 mono
+    SEND_BATCH_DELAY = 0.1    # Max seconds to hold the first buffered block
+    MAX_BACKLOG_BLOCKS = 8    # Blocks (~2s) buffered before old audio is dropped
+    AUDIO_BUFFER_BLOCKS = 32  # Ring buffer capacity (~8s); the oldest block is overwritten when full
+    
 
 # ========================================
 # File Output Configuration
@@ -106,6 +132,9 @@ class OutputConfig:
     FILE_PREFIX = "echolog"
     FILE_EXTENSION = ".md"
     
+    # Files in OUTPUT_DIR that count as recordings (history list, daily summaries)
+    RECORDING_EXTENSIONS = (".md", ".txt")
+    
     # Timestamp format for filenames
     FILENAME_TIME_FORMAT = "%Y%m%d_%H%M%S"
     
@@ -115,6 +144,15 @@ class OutputConfig:
     # Whether to include timestamps in the output
     INCLUDE_TIMESTAMPS = True
     
+    # Header written at the top of each new session file
+    HEADER_TEMPLATE = "# EchoLog 听写记录\n> 创建时间: {created}\n\n---\n\n"
+    HEADER_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+    
+    @classmethod
+    def is_recording_file(cls, name: str) -> bool:
+        """Whether a file name is a recording; case-insensitive only where the OS is, like Path.glob"""
+        return os.path.normcase(name).endswith(cls.RECORDING_EXTENSIONS)
+    
     @classmethod
     def ensure_output_dir(cls) -> Path:
         """Ensure the output directory exists"""
@@ -139,6 +177,8 @@ class GUIConfig:
     # Text display
     FONT_FAMILY = "Microsoft YaHei"  # 微软雅黑 for Chinese support
     FONT_SIZE = 14
+    INTERIM_FLUSH_MS = 33  # Interim partials are drawn at most once per interval
+    AUTOSCROLL_MS = 33     # Scroll-to-end runs at most once per interval
     
     # Status colors
     COLOR_RECORDING = "#FF4444"   # Red when recording
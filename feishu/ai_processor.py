@@ -7,11 +7,19 @@ AI 内容处理模块
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    _json_loads = json.loads
+
 
 class AIProcessor:
     """AI 内容处理器"""
@@ -60,6 +68,27 @@ JSON 格式示例：
         
         if not self.api_key:
             raise ValueError("请配置 DEEPSEEK_API_KEY 环境变量")
+        
+        self._session = self._create_session()
+    
+    def _create_session(self) -> requests.Session:
+        """创建复用 TCP/TLS 连接的 Session，并对临时错误自动重试"""
+        session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,  # 交给 raise_for_status 处理最终状态
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        return session
     
     def process_content(self, raw_content: str) -> Dict[str, Any]:
         """
@@ -90,11 +119,6 @@ JSON 格式示例：
         """调用 DeepSeek API"""
         url = f"{self.api_url}/v1/chat/completions"
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         # 限制内容长度（避免超长）
         max_chars = 50000  # 约 12k tokens
         if len(content) > max_chars:
@@ -111,16 +135,16 @@ JSON 格式示例：
             "response_format": {"type": "json_object"}
         }
         
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = self._session.post(url, json=data, timeout=60)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         return result["choices"][0]["message"]["content"]
     
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """解析 API 响应"""
         try:
-            data = json.loads(response)
+            data = _json_loads(response)
             
             return {
                 "success": True,
@@ -4,20 +4,60 @@
 处理认证和基础 API 调用
 """
 
+import json
+import logging
 import os
+import threading
 import time
+from pathlib import Path
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
+
+# 进程内共享的 token 缓存：app_id -> (token, 过期时间戳)
+# DocsClient / BitableClient 等子类实例共用同一个 token，不再各自认证
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+
+
+def create_session() -> requests.Session:
+    """创建复用连接的 Session（keep-alive + 临时错误重试），飞书相关请求统一使用"""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
 
 class FeishuClient:
     """飞书 API 客户端基类"""
     
     BASE_URL = "https://open.feishu.cn/open-apis"
     
+    # 跨进程复用 token 的缓存文件（仅当前用户可读写）
+    TOKEN_CACHE_FILE = Path.home() / ".cache" / "echolog" / "feishu_token.json"
+    # 提前刷新的缓冲时间（秒）
+    TOKEN_REFRESH_MARGIN = 60
+    
     def __init__(self):
         self.app_id = os.getenv("FEISHU_APP_ID")
         self.app_secret = os.getenv("FEISHU_APP_SECRET")
@@ -25,62 +65,107 @@ class FeishuClient:
         if not self.app_id or not self.app_secret:
             raise ValueError("请配置 FEISHU_APP_ID 和 FEISHU_APP_SECRET 环境变量")
         
-        self._access_token: Optional[str] = None
-        self._token_expire_time: float = 0
+        self._session = create_session()
+        self.logger = logging.getLogger("EchoLog.Feishu")
+    
+    def close(self):
+        """关闭底层 HTTP 连接池"""
+        self._session.close()
     
     @property
     def access_token(self) -> str:
-        """获取 access_token，自动刷新过期的 token"""
-        if self._access_token and time.time() < self._token_expire_time - 60:
-            return self._access_token
+        """获取 access_token，自动刷新过期的 token（进程内及跨进程共享）"""
+        cached = self._valid_token(_TOKEN_CACHE.get(self.app_id))
+        if cached:
+            return cached
         
-        self._refresh_token()
-        return self._access_token
+        with _TOKEN_LOCK:
+            cached = self._valid_token(_TOKEN_CACHE.get(self.app_id))
+            if cached:
+                return cached
+            
+            entry = self._load_token_file()
+            if not self._valid_token(entry):
+                entry = self._refresh_token()
+                self._save_token_file(entry)
+            
+            _TOKEN_CACHE[self.app_id] = entry
+            return entry[0]
+    
+    def _valid_token(self, entry: Optional[Tuple[str, float]]) -> Optional[str]:
+        """token 未过期（含提前刷新缓冲）时返回 token，否则返回 None"""
+        if entry and time.time() < entry[1] - self.TOKEN_REFRESH_MARGIN:
+            return entry[0]
+        return None
+    
+    def _load_token_file(self) -> Optional[Tuple[str, float]]:
+        """从缓存文件读取其他进程获取的 token"""
+        try:
+            with open(self.TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("app_id") == self.app_id:
+                return data["token"], float(data["exp"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_token_file(self, entry: Tuple[str, float]):
+        """将 token 写入缓存文件，失败时忽略（下次重新认证即可）"""
+        try:
+            self.TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.TOKEN_CACHE_FILE.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"app_id": self.app_id, "token": entry[0], "exp": entry[1]}, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.TOKEN_CACHE_FILE)
+        except OSError as e:
+            self.logger.warning("保存 access_token 缓存失败: %s", e)
     
-    def _refresh_token(self):
-        """刷新 tenant_access_token"""
+    def _refresh_token(self) -> Tuple[str, float]:
+        """刷新 tenant_access_token，返回 (token, 过期时间戳)"""
         url = f"{self.BASE_URL}/auth/v3/tenant_access_token/internal"
         payload = {
             "app_id": self.app_id,
             "app_secret": self.app_secret
         }
         
-        response = requests.post(url, json=payload, timeout=30)
-        data = response.json()
+        response = self._session.post(url, data=_json_dumps(payload), timeout=30)
+        data = _json_loads(response.content)
         
         if data.get("code") != 0:
             raise Exception(f"获取 access_token 失败: {data}")
         
-        self._access_token = data["tenant_access_token"]
-        self._token_expire_time = time.time() + data["expire"]
+        return data["tenant_access_token"], time.time() + data["expire"]
     
     def _get_headers(self) -> Dict[str, str]:
-        """获取请求头"""
+        """获取请求头（Content-Type 已设置在 Session 上）"""
         return {
             "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
         }
     
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """发送 GET 请求"""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.get(url, headers=self._get_headers(), params=params, timeout=30)
-        return response.json()
+        response = self._session.get(url, headers=self._get_headers(), params=params, timeout=30)
+        return _json_loads(response.content)
     
     def post(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """发送 POST 请求"""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.post(url, headers=self._get_headers(), json=data, timeout=30)
-        return response.json()
+        body = _json_dumps(data) if data is not None else None
+        response = self._session.post(url, headers=self._get_headers(), data=body, timeout=30)
+        return _json_loads(response.content)
     
     def put(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """发送 PUT 请求"""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.put(url, headers=self._get_headers(), json=data, timeout=30)
-        return response.json()
+        body = _json_dumps(data) if data is not None else None
+        response = self._session.put(url, headers=self._get_headers(), data=body, timeout=30)
+        return _json_loads(response.content)
     
     def delete(self, endpoint: str) -> Dict[str, Any]:
         """发送 DELETE 请求"""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.delete(url, headers=self._get_headers(), timeout=30)
-        return response.json()
+        response = self._session.delete(url, headers=self._get_headers(), timeout=30)
+        return _json_loads(response.content)
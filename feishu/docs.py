@@ -5,13 +5,68 @@
 """
 
 import os
+import re
 from typing import Optional, Dict, Any, List
 from .client import FeishuClient
 
 
+# 行首标记：标题 / 待办 / 无序列表 / 引用（对已 strip 的单行匹配）
+# 与按前缀长度查表（l[:6] / l[:4] / l[:3] / l[:2] 逐级 dict.get）对比测试过，单次 match 略快，故保留正则
+_MD_PREFIX_RE = re.compile(r"(?P<heading>#{1,3}) |- \[(?P<todo>[ xX])\] |(?P<bullet>[-*]) |(?P<quote>>) ")
+
+# 所有文本元素共用同一个空样式（只读，序列化时不会被修改）
+_EMPTY_TEXT_STYLE: Dict[str, Any] = {}
+
+# 一级 ~ 三级标题 (block_type: 3 ~ 5)
+_HEADING_TYPES = {1: (3, "heading1"), 2: (4, "heading2"), 3: (5, "heading3")}
+
+
+def _elements(content: str) -> List[Dict[str, Any]]:
+    return [{"text_run": {"content": content, "text_element_style": _EMPTY_TEXT_STYLE}}]
+
+
+def _text_block(content: str) -> Dict[str, Any]:
+    # 普通文本段落 (block_type: 2)
+    return {"block_type": 2, "text": {"elements": _elements(content)}}
+
+
+def _heading_block(m: "re.Match", content: str) -> Dict[str, Any]:
+    block_type, key = _HEADING_TYPES[len(m.group("heading"))]
+    return {"block_type": block_type, key: {"elements": _elements(content)}}
+
+
+def _todo_block(m: "re.Match", content: str) -> Dict[str, Any]:
+    # 待办事项 (block_type: 17)，[x]/[X] 为已完成
+    return {
+        "block_type": 17,
+        "todo": {"elements": _elements(content), "style": {"done": m.group("todo") != " "}}
+    }
+
+
+def _bullet_block(m: "re.Match", content: str) -> Dict[str, Any]:
+    # 无序列表 (block_type: 12)
+    return {"block_type": 12, "bullet": {"elements": _elements(content)}}
+
+
+def _quote_block(m: "re.Match", content: str) -> Dict[str, Any]:
+    # 引用块 (block_type: 14) 需要 quote_container 结构，这里用文本块代替，避免结构问题
+    return _text_block(f"📝 {content}")
+
+
+_BLOCK_BUILDERS = {
+    "heading": _heading_block,
+    "todo": _todo_block,
+    "bullet": _bullet_block,
+    "quote": _quote_block,
+}
+
+
 class DocsClient(FeishuClient):
     """飞书云文档客户端"""
     
+    # 创建子块接口单次最多接受 50 个 children
+    MAX_CHILDREN_PER_REQUEST = 50
+    
     def __init__(self, folder_token: Optional[str] = None):
         super().__init__()
         self.folder_token = folder_token or os.getenv("FEISHU_FOLDER_TOKEN")
@@ -40,12 +95,16 @@ class DocsClient(FeishuClient):
     
     def create_block(self, document_id: str, block_type: int, content: Dict) -> Dict:
         """在文档中创建块"""
+        return self.create_children(document_id, [{
+            "block_type": block_type,
+            **content
+        }])
+    
+    def create_children(self, document_id: str, children: List[Dict[str, Any]]) -> Dict:
+        """在文档末尾一次性创建多个块（最多 MAX_CHILDREN_PER_REQUEST 个）"""
         endpoint = f"docx/v1/documents/{document_id}/blocks/{document_id}/children"
         data = {
-            "children": [{
-                "block_type": block_type,
-                **content
-            }],
+            "children": children,
             "index": -1
         }
         
@@ -56,111 +115,47 @@ class DocsClient(FeishuClient):
         return result.get("data", {})
     
     def append_markdown(self, document_id: str, markdown_content: str) -> bool:
-        """将 Markdown 内容追加到文档"""
+        """将 Markdown 内容追加到文档（按批提交，而不是每行一次请求）"""
         blocks = self._markdown_to_blocks(markdown_content)
+        batch_size = self.MAX_CHILDREN_PER_REQUEST
         
-        for block in blocks:
+        for i in range(0, len(blocks), batch_size):
+            batch = blocks[i:i + batch_size]
             try:
-                self.create_block(document_id, block["type"], block["content"])
+                self.create_children(document_id, batch)
             except Exception as e:
-                print(f"添加块失败: {e}")
+                self.logger.warning("批量添加块失败，改为逐块添加: %s", e)
+                # 逐块重试，避免一个无效块导致整批内容丢失；失败的块只汇总记录一次
+                failed = 0
+                last_error = None
+                for block in batch:
+                    try:
+                        self.create_children(document_id, [block])
+                    except Exception as block_error:
+                        failed += 1
+                        last_error = block_error
+                if failed:
+                    self.logger.warning("%d/%d 个块添加失败，最后一个错误: %s", failed, len(batch), last_error)
         
         return True
     
     def _markdown_to_blocks(self, markdown: str) -> List[Dict[str, Any]]:
-        """将 Markdown 转换为飞书文档块格式"""
+        """将 Markdown 转换为飞书文档块格式（可直接作为 children 提交）"""
         blocks = []
-        lines = markdown.split("\n")
+        match_prefix = _MD_PREFIX_RE.match
         
-        for line in lines:
+        for line in markdown.split("\n"):
             line = line.strip()
             if not line:
                 continue
             
-            # 处理不同类型的 Markdown 元素
-            if line.startswith("# "):
-                # 一级标题 (block_type: 3)
-                blocks.append({
-                    "type": 3,
-                    "content": {
-                        "heading1": {
-                            "elements": [{"text_run": {"content": line[2:], "text_element_style": {}}}]
-                        }
-                    }
-                })
-            elif line.startswith("## "):
-                # 二级标题 (block_type: 4)
-                blocks.append({
-                    "type": 4,
-                    "content": {
-                        "heading2": {
-                            "elements": [{"text_run": {"content": line[3:], "text_element_style": {}}}]
-                        }
-                    }
-                })
-            elif line.startswith("### "):
-                # 三级标题 (block_type: 5)
-                blocks.append({
-                    "type": 5,
-                    "content": {
-                        "heading3": {
-                            "elements": [{"text_run": {"content": line[4:], "text_element_style": {}}}]
-                        }
-                    }
-                })
-            elif line.startswith("- [ ] "):
-                # 待办事项-未完成 (block_type: 17)
-                blocks.append({
-                    "type": 17,
-                    "content": {
-                        "todo": {
-                            "elements": [{"text_run": {"content": line[6:], "text_element_style": {}}}],
-                            "style": {"done": False}
-                        }
-                    }
-                })
-            elif line.startswith("- [x] ") or line.startswith("- [X] "):
-                # 待办事项-已完成 (block_type: 17)
-                blocks.append({
-                    "type": 17,
-                    "content": {
-                        "todo": {
-                            "elements": [{"text_run": {"content": line[6:], "text_element_style": {}}}],
-                            "style": {"done": True}
-                        }
-                    }
-                })
-            elif line.startswith("- ") or line.startswith("* "):
-                # 无序列表 (block_type: 12)
-                blocks.append({
-                    "type": 12,
-                    "content": {
-                        "bullet": {
-                            "elements": [{"text_run": {"content": line[2:], "text_element_style": {}}}]
-                        }
-                    }
-                })
-            elif line.startswith("> "):
-                # 引用块 (block_type: 14)
-                # 引用块结构不同，需要使用 quote_container
-                blocks.append({
-                    "type": 2,  # 使用文本块代替引用块，避免结构问题
-                    "content": {
-                        "text": {
-                            "elements": [{"text_run": {"content": f"📝 {line[2:]}", "text_element_style": {}}}]
-                        }
-                    }
-                })
+            # 一次正则匹配完成行类型判断，再按类型查表构建块
+            m = match_prefix(line)
+            if m is None:
+                # 普通文本段落
+                blocks.append(_text_block(line))
             else:
-                # 普通文本段落 (block_type: 2)
-                blocks.append({
-                    "type": 2,
-                    "content": {
-                        "text": {
-                            "elements": [{"text_run": {"content": line, "text_element_style": {}}}]
-                        }
-                    }
-                })
+                blocks.append(_BLOCK_BUILDERS[m.lastgroup](m, line[m.end():]))
         
         return blocks
     
@@ -4,50 +4,94 @@
 负责聚合当天的录音记录，生成日报并同步到飞书
 """
 
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import date as Date, datetime, time as dtime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 from config import OutputConfig
 
 
 class DailySummaryService:
     """每日汇总服务"""
     
+    # 目录索引的最长复用时间（秒）；正在录音的文件 mtime 会变化，但不会改变目录 mtime
+    INDEX_TTL = 5.0
+    # 并发读取文件的最大线程数（读文件时会释放 GIL，适合网络盘等慢速存储）
+    MAX_READ_WORKERS = 16
+    # 月度统计缓存目录（month_stats_<输出目录哈希>_YYYYMM.json），内容未变化的日期不再重新读取
+    STATS_CACHE_DIR = Path.home() / ".cache" / "echolog"
+    
     def __init__(self):
         self.output_dir = OutputConfig.OUTPUT_DIR
+        self._index_key: Optional[Tuple[str, int]] = None
+        self._index_time = 0.0
+        self._date_index: Dict[Date, List[Path]] = {}
+        self._file_mtimes: Dict[Path, float] = {}
     
-    def get_today_files(self) -> List[Path]:
-        """获取今天的所有录音文件"""
-        today = datetime.now().date()
-        files = []
+    def _index_files_by_date(self) -> Dict[Date, List[Path]]:
+        """
+        扫描一次输出目录，按修改日期分组（组内按修改时间排序）
         
-        for ext in ["*.md", "*.txt"]:
-            for filepath in self.output_dir.glob(ext):
+        目录未变化且在 INDEX_TTL 内时直接复用上次的结果，
+        避免月报/周报逐日查询时反复 glob + stat 整个目录。
+        """
+        try:
+            key = (str(self.output_dir), os.stat(self.output_dir).st_mtime_ns)
+        except OSError:
+            return {}
+        
+        now = time.monotonic()
+        if key == self._index_key and now - self._index_time < self.INDEX_TTL:
+            return self._date_index
+        
+        entries = []
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                if not OutputConfig.is_recording_file(entry.name):
+                    continue
                 try:
-                    mod_time = datetime.fromtimestamp(filepath.stat().st_mtime)
-                    if mod_time.date() == today:
-                        files.append(filepath)
-                except:
+                    if entry.is_file():
+                        entries.append((entry.stat().st_mtime, Path(entry.path)))
+                except OSError:
                     continue
         
-        return sorted(files, key=lambda x: x.stat().st_mtime)
+        entries.sort(key=lambda item: item[0])
+        date_index: Dict[Date, List[Path]] = {}
+        # 文件已按 mtime 排序：用当天的 [起始, 结束) 时间戳做浮点比较，
+        # 只有跨天时才调用 fromtimestamp，而不是每个文件都转换一次
+        day_start = day_end = 0.0
+        bucket: List[Path] = []
+        for mtime, filepath in entries:
+            if not day_start <= mtime < day_end:
+                day = datetime.fromtimestamp(mtime).date()
+                day_start = datetime.combine(day, dtime.min).timestamp()
+                day_end = datetime.combine(day + timedelta(days=1), dtime.min).timestamp()
+                bucket = date_index.setdefault(day, [])
+            bucket.append(filepath)
+        
+        self._date_index = date_index
+        self._file_mtimes = {filepath: mtime for mtime, filepath in entries}
+        self._index_key = key
+        self._index_time = now
+        return date_index
+    
+    def get_today_files(self) -> List[Path]:
+        """获取今天的所有录音文件"""
+        return list(self._index_files_by_date().get(datetime.now().date(), []))
     
     def get_files_by_date(self, date: datetime) -> List[Path]:
         """获取指定日期的所有文件"""
-        target_date = date.date()
-        files = []
-        
-        for ext in ["*.md", "*.txt"]:
-            for filepath in self.output_dir.glob(ext):
-                try:
-                    mod_time = datetime.fromtimestamp(filepath.stat().st_mtime)
-                    if mod_time.date() == target_date:
-                        files.append(filepath)
-                except:
-                    continue
-        
-        return sorted(files, key=lambda x: x.stat().st_mtime)
+        return list(self._index_files_by_date().get(date.date(), []))
+    
+    @staticmethod
+    def week_start(end_date: datetime) -> datetime:
+        """返回 end_date 所在周的周一 00:00"""
+        start_date = end_date - timedelta(days=end_date.weekday())
+        return start_date.replace(hour=0, minute=0, second=0, microsecond=0)
     
     def read_file_content(self, filepath: Path) -> str:
         """读取文件内容"""
@@ -63,8 +107,7 @@ class DailySummaryService:
             end_date = datetime.now()
         
         # Calculate start of the week (Monday)
-        start_date = end_date - timedelta(days=end_date.weekday())
-        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_date = self.week_start(end_date)
         
         all_contents = []
         total_words = 0
@@ -72,12 +115,8 @@ class DailySummaryService:
         all_files = []
         
         # Iterate through each day of the week up to end_date
-        for i in range(7):
-            current_date = start_date + timedelta(days=i)
-            if current_date.date() > end_date.date():
-                break
-            
-            data = self.aggregate_daily_content(current_date)
+        for data in self._aggregate_range(start_date, end_date).values():
+            current_date = data["date"]
             if data["contents"]:
                  # Add a separator/header for the day
                  all_contents.append({
@@ -101,6 +140,40 @@ class DailySummaryService:
             "file_count": file_count
         }
 
+    def _read_files(self, files: List[Path]) -> List[str]:
+        """按顺序读取多个文件，多于一个时并发读取"""
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_READ_WORKERS, len(files))) as executor:
+                return list(executor.map(self.read_file_content, files))
+        return [self.read_file_content(filepath) for filepath in files]
+    
+    def _aggregate_range(self, start: datetime, end: datetime) -> Dict[Date, Dict[str, Any]]:
+        """
+        聚合 start ~ end（按日期，含两端）每一天的内容
+        
+        返回按日期排列的 {date: aggregate_daily_content 格式的结果}
+        """
+        days = [start + timedelta(days=i) for i in range((end.date() - start.date()).days + 1)]
+        return self._aggregate_days(days)
+    
+    def _aggregate_days(
+        self, days: List[datetime], index: Optional[Dict[Date, List[Path]]] = None
+    ) -> Dict[Date, Dict[str, Any]]:
+        """
+        聚合给定的若干天（一次索引查询 + 一个线程池读取所有文件）
+        
+        index 为调用方已取得的目录索引快照时直接使用，保证与调用方看到的文件一致。
+        """
+        if index is None:
+            index = self._index_files_by_date()
+        files_by_day = [list(index.get(day.date(), [])) for day in days]
+        
+        file_contents = iter(self._read_files([f for files in files_by_day for f in files]))
+        return {
+            day.date(): self._build_daily_content(day, files, [next(file_contents) for _ in files])
+            for day, files in zip(days, files_by_day)
+        }
+    
     def aggregate_daily_content(self, date: Optional[datetime] = None) -> Dict[str, Any]:
         """
         聚合一天的所有内容
@@ -112,13 +185,17 @@ class DailySummaryService:
             date = datetime.now()
         
         files = self.get_files_by_date(date)
+        return self._build_daily_content(date, files, self._read_files(files))
+    
+    def _build_daily_content(self, date: datetime, files: List[Path], file_contents: List[str]) -> Dict[str, Any]:
+        """由一天的文件及其内容组装聚合结果"""
         contents = []
         total_words = 0
         
-        for filepath in files:
-            content = self.read_file_content(filepath)
+        for filepath, content in zip(files, file_contents):
             if content:
-                mod_time = datetime.fromtimestamp(filepath.stat().st_mtime)
+                mtime = self._file_mtimes.get(filepath)
+                mod_time = datetime.fromtimestamp(mtime if mtime is not None else filepath.stat().st_mtime)
                 contents.append({
                     "filename": filepath.name,
                     "time": mod_time.strftime("%H:%M"),
@@ -154,8 +231,16 @@ class DailySummaryService:
         
         # 摘要（简单版本：取前 200 字）
         lines.append("## 📝 今日摘要")
-        all_content = " ".join([c["content"] for c in data["contents"]])
-        summary = all_content[:200] + "..." if len(all_content) > 200 else all_content
+        # 只拼接够 200 字所需的前几条，避免为了截取摘要拼出整天的全文
+        parts = []
+        length = -1
+        for c in data["contents"]:
+            parts.append(c["content"])
+            length += len(c["content"]) + 1
+            if length > 200:
+                break
+        all_content = " ".join(parts)
+        summary = all_content[:200] + "..." if length > 200 else all_content
         lines.append(f"> {summary}")
         lines.append("")
         
@@ -164,12 +249,14 @@ class DailySummaryService:
         lines.append("")
         
         for item in data["contents"]:
-            lines.append(f"### {item['time']} - {item['filename']}")
-            lines.append("")
-            lines.append(item["content"])
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            lines.extend((
+                f"### {item['time']} - {item['filename']}",
+                "",
+                item["content"],
+                "",
+                "---",
+                "",
+            ))
         
         return "\n".join(lines)
     
@@ -179,7 +266,7 @@ class DailySummaryService:
             end_date = datetime.now()
         
         # 获取本周一到周日的数据
-        start_date = end_date - timedelta(days=end_date.weekday())
+        start_date = self.week_start(end_date)
         
         lines = []
         lines.append(f"# 📊 {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')} 周报")
@@ -189,12 +276,8 @@ class DailySummaryService:
         total_words = 0
         daily_summaries = []
         
-        for i in range(7):
-            current_date = start_date + timedelta(days=i)
-            if current_date > end_date:
-                break
-            
-            data = self.aggregate_daily_content(current_date)
+        for data in self._aggregate_range(start_date, end_date).values():
+            current_date = data["date"]
             total_files += data["file_count"]
             total_words += data["total_words"]
             
@@ -232,21 +315,70 @@ class DailySummaryService:
         lines.append(f"# 📈 {date.strftime('%Y年%m月')} 月报")
         lines.append("")
         
-        total_files = 0
-        total_words = 0
-        
-        current = first_day
-        while current <= min(last_day, date):
-            data = self.aggregate_daily_content(current)
-            total_files += data["file_count"]
-            total_words += data["total_words"]
-            current += timedelta(days=1)
+        total_files, total_words = self._monthly_totals(first_day, min(last_day, date))
         
         lines.append(f"> 本月共 {total_files} 条记录，{total_words} 字")
         lines.append("")
         
         return "\n".join(lines)
 
+    
+    def _month_stats_path(self, date: datetime) -> Path:
+        # 按输出目录区分缓存文件：打包版与源码运行的 APP_ROOT 不同，不能共用统计
+        dir_hash = hashlib.sha1(str(self.output_dir.resolve()).encode("utf-8")).hexdigest()[:12]
+        return self.STATS_CACHE_DIR / f"month_stats_{dir_hash}_{date.strftime('%Y%m')}.json"
+    
+    def _monthly_totals(self, first_day: datetime, end: datetime) -> Tuple[int, int]:
+        """
+        统计 first_day ~ end 的记录数和字数
+        
+        每天的结果连同文件签名（文件数, 最大 mtime）缓存在 sidecar 文件中，
+        签名未变化的日期直接复用缓存，只重新读取有变化的日期。
+        """
+        # 签名与聚合使用同一份索引快照，避免索引在两者之间重建导致统计与签名不匹配
+        index = self._index_files_by_date()
+        file_mtimes = self._file_mtimes
+        days = [first_day + timedelta(days=i) for i in range((end.date() - first_day.date()).days + 1)]
+        
+        stats_path = self._month_stats_path(first_day)
+        try:
+            with open(stats_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+        
+        stats = {}
+        stale_days = []
+        for day in days:
+            files = index.get(day.date(), [])
+            signature = [len(files), max((file_mtimes.get(f, 0.0) for f in files), default=0.0)]
+            key = day.date().isoformat()
+            entry = cached.get(key)
+            if isinstance(entry, list) and entry[2:] == signature:
+                stats[key] = entry
+            else:
+                stats[key] = signature
+                stale_days.append(day)
+        
+        if stale_days:
+            for day_date, data in self._aggregate_days(stale_days, index).items():
+                key = day_date.isoformat()
+                stats[key] = [data["file_count"], data["total_words"]] + stats[key]
+            self._save_month_stats(stats_path, stats)
+        
+        return sum(entry[0] for entry in stats.values()), sum(entry[1] for entry in stats.values())
+    
+    def _save_month_stats(self, stats_path: Path, stats: Dict[str, List]):
+        """原子写入月度统计缓存（先写临时文件再 os.replace），失败时忽略"""
+        try:
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = stats_path.with_name(f"{stats_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, stats_path)
+        except OSError:
+            pass
+
 
 # 单例
 _daily_summary_service = None
@@ -4,6 +4,8 @@
 负责将每日汇总同步到飞书多维表格和云文档
 """
 
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, Any
 from .bitable import BitableClient
@@ -19,6 +21,9 @@ class FeishuSyncService:
         self.docs_client: Optional[DocsClient] = None
         self.summary_service: DailySummaryService = get_daily_summary_service()
         self._initialized = False
+        self.logger = logging.getLogger("EchoLog.FeishuSync")
+        # 文档正文写入与多维表格记录互不依赖，放到后台线程并行执行
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="feishu-sync")
     
     def initialize(self) -> bool:
         """初始化飞书客户端"""
@@ -28,13 +33,24 @@ class FeishuSyncService:
             self._initialized = True
             return True
         except Exception as e:
-            print(f"初始化飞书客户端失败: {e}")
+            self.logger.error("初始化飞书客户端失败: %s", e)
             return False
     
+    def close(self):
+        """等待后台写入完成并关闭线程池和 HTTP 连接池（关闭后不可再使用）"""
+        self._executor.shutdown(wait=True)
+        for client in (self.bitable_client, self.docs_client):
+            if client is not None:
+                client.close()
+    
     @property
     def is_initialized(self) -> bool:
         return self._initialized
     
+    def _append_markdown_in_background(self, document_id: str, markdown_content: str) -> Future:
+        """在后台线程写入文档正文，返回 Future"""
+        return self._executor.submit(self.docs_client.append_markdown, document_id, markdown_content)
+    
     def sync_daily_report(self, date: Optional[datetime] = None, use_ai: bool = True) -> Dict[str, Any]:
         """
         同步日报到飞书
@@ -75,6 +91,7 @@ class FeishuSyncService:
             todo_count = 0
             keywords = ["会议"]
             doc_url = None
+            append_future: Optional[Future] = None
             
             # 3. AI 处理（如果启用）
             if use_ai:
@@ -93,15 +110,15 @@ class FeishuSyncService:
                         
                         try:
                             doc = self.docs_client.create_document(title)
-                            self.docs_client.append_markdown(doc["document_id"], markdown_content)
+                            append_future = self._append_markdown_in_background(doc["document_id"], markdown_content)
                             doc_url = doc["url"]
                         except Exception as doc_error:
-                            print(f"创建云文档失败: {doc_error}")
+                            self.logger.warning("创建云文档失败: %s", doc_error)
                     else:
                         # AI 处理失败，使用原始内容
                         summary = data["contents"][0]["content"][:100] + "..."
                 except Exception as ai_error:
-                    print(f"AI 处理失败: {ai_error}")
+                    self.logger.warning("AI 处理失败: %s", ai_error)
                     summary = data["contents"][0]["content"][:100] + "..."
             else:
                 summary = data["contents"][0]["content"][:100] + "..."
@@ -116,6 +133,12 @@ class FeishuSyncService:
                 keywords=keywords if keywords else ["会议"]
             )
             
+            if append_future is not None:
+                try:
+                    append_future.result()
+                except Exception as doc_error:
+                    self.logger.warning("写入云文档内容失败: %s", doc_error)
+            
             return {
                 "success": True,
                 "message": "同步成功" + ("（含 AI 处理）" if use_ai and doc_url else ""),
@@ -148,13 +171,11 @@ class FeishuSyncService:
             markdown_content = self.summary_service.generate_weekly_markdown(end_date)
             
             # 创建云文档
-            start_date = end_date
-            while start_date.weekday() != 0:  # 找到本周一
-                start_date = start_date.replace(day=start_date.day - 1)
+            start_date = self.summary_service.week_start(end_date)  # 本周一
             
             title = f"📊 {start_date.strftime('%m.%d')}-{end_date.strftime('%m.%d')} 周报"
             doc = self.docs_client.create_document(title)
-            self.docs_client.append_markdown(doc["document_id"], markdown_content)
+            append_future = self._append_markdown_in_background(doc["document_id"], markdown_content)
             
             # 在多维表格创建记录
             record = self.bitable_client.create_weekly_report(
@@ -163,6 +184,7 @@ class FeishuSyncService:
                 summary=f"本周工作汇总",
                 doc_url=doc["url"]
             )
+            append_future.result()
             
             return {
                 "success": True,
@@ -193,7 +215,7 @@ class FeishuSyncService:
             # 创建云文档
             title = f"📈 {date.strftime('%Y年%m月')} 月报"
             doc = self.docs_client.create_document(title)
-            self.docs_client.append_markdown(doc["document_id"], markdown_content)
+            append_future = self._append_markdown_in_background(doc["document_id"], markdown_content)
             
             # 在多维表格创建记录
             record = self.bitable_client.create_monthly_report(
@@ -202,6 +224,7 @@ class FeishuSyncService:
                 summary=f"{date.strftime('%Y年%m月')} 工作汇总",
                 doc_url=doc["url"]
             )
+            append_future.result()
             
             return {
                 "success": True,
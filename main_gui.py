@@ -6,20 +6,31 @@ Left sidebar navigation + Right content area.
 """
 
 import asyncio
+import bisect
+import concurrent.futures
+import functools
+import operator
 import threading
 import sys
 import os
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, List, Tuple
 import re
 import webbrowser
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from audio_engine import TranscriptionEngine
 from config import GUIConfig, OutputConfig, DeepgramConfig
 
+# The audio engine is imported when recording starts, keeping it off the
+# startup path.
+if TYPE_CHECKING:
+    from audio_engine import TranscriptionEngine
+
 
 # ========================================
 # Color Theme (Typeless-inspired)
@@ -59,6 +70,87 @@ class Colors:
     ERROR = "#FF3B30"
 
 
+# ========================================
+# Shared Fonts
+# ========================================
+@functools.lru_cache(maxsize=64)
+def _font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """One shared CTkFont per (size, weight, family) instead of one per widget"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+# ========================================
+# Shared Event Bindings
+# ========================================
+# Card-style widgets route their mouse events through one bind tag per
+# widget class instead of binding every child widget individually
+_BOUND_TAGS = set()
+
+
+def _tk_parts(widget) -> list:
+    """The widget plus the plain Tk widgets CustomTkinter draws it with"""
+    return [widget] + [c for c in widget.winfo_children() if not isinstance(c, ctk.CTkBaseClass)]
+
+
+def _dispatch_tagged(event, owner_cls, method: str):
+    """Call `method` on the nearest `owner_cls` ancestor of the event widget"""
+    widget = event.widget
+    while widget is not None and not isinstance(widget, owner_cls):
+        widget = getattr(widget, "master", None)
+    if widget is not None:
+        getattr(widget, method)(event)
+
+
+def _bind_via_tag(owner_cls, tag: str, widgets: list, handlers: dict):
+    """Attach `widgets` to a shared bind tag whose handlers call owner_cls methods"""
+    if tag not in _BOUND_TAGS:
+        root = widgets[0].nametowidget(".")
+        for sequence, method in handlers.items():
+            root.bind_class(tag, sequence, lambda e, m=method: _dispatch_tagged(e, owner_cls, m))
+        _BOUND_TAGS.add(tag)
+    for widget in widgets:
+        for part in _tk_parts(widget):
+            part.bindtags((tag,) + part.bindtags())
+
+
+# Keeps a textbox editable at the Tk level but ignores user edits, so
+# program updates skip the configure(state=...) round trip per write
+_READ_ONLY_TAG = "EchoLogReadOnly"
+_READ_ONLY_KEYS = frozenset({
+    "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+    "Shift_L", "Shift_R", "Control_L", "Control_R", "Meta_L", "Meta_R",
+    "Alt_L", "Alt_R", "Super_L", "Super_R", "Escape",
+})
+# Modifier bits that make c / a / Insert a copy or select-all shortcut.
+# Control (0x4) everywhere; 0x8 is Command only on aqua (on Windows/X11 it
+# is Mod1, which NumLock sets), so it is added in _make_read_only on macOS.
+_copy_modifiers = 0x4
+
+
+def _read_only_key(event):
+    """Let navigation, copy and select-all through; swallow every other key"""
+    if event.keysym in _READ_ONLY_KEYS:
+        return None
+    if event.state & _copy_modifiers and event.keysym.lower() in ("c", "a", "insert"):
+        return None
+    return "break"
+
+
+def _make_read_only(widget):
+    """Route `widget`'s edit events through the shared read-only bind tag"""
+    global _copy_modifiers
+    if _READ_ONLY_TAG not in _BOUND_TAGS:
+        root = widget.nametowidget(".")
+        if widget.tk.call("tk", "windowingsystem") == "aqua":
+            _copy_modifiers = 0x4 | 0x8
+        root.bind_class(_READ_ONLY_TAG, "<Key>", _read_only_key)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            root.bind_class(_READ_ONLY_TAG, sequence, lambda e: "break")
+        _BOUND_TAGS.add(_READ_ONLY_TAG)
+    for part in _tk_parts(widget):
+        part.bindtags((_READ_ONLY_TAG,) + part.bindtags())
+
+
 # ========================================
 # Navigation Item Widget
 # ========================================
@@ -79,7 +171,7 @@ class NavItem(ctk.CTkFrame):
         self.icon_label = ctk.CTkLabel(
             self,
             text=icon,
-            font=ctk.CTkFont(size=20),  # Larger icons
+            font=_font(20),  # Larger icons
             text_color=Colors.SIDEBAR_TEXT,
             width=40,
         )
@@ -89,17 +181,18 @@ class NavItem(ctk.CTkFrame):
         self.text_label = ctk.CTkLabel(
             self,
             text=text,
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"), # Bolder text
+            font=_font(14, "bold", family="Segoe UI"), # Bolder text
             text_color=Colors.SIDEBAR_TEXT,
             anchor="w",
         )
         self.text_label.pack(side="left", fill="x", pady=12)
         
         # Bind events
-        for widget in [self, self.icon_label, self.text_label]:
-            widget.bind("<Enter>", self._on_enter)
-            widget.bind("<Leave>", self._on_leave)
-            widget.bind("<Button-1>", self._on_click)
+        _bind_via_tag(NavItem, "EchoLogNavItem", [self, self.icon_label, self.text_label], {
+            "<Enter>": "_on_enter",
+            "<Leave>": "_on_leave",
+            "<Button-1>": "_on_click",
+        })
             
     def _on_enter(self, event):
         if not self._is_active:
@@ -164,7 +257,7 @@ class SearchResultItem(ctk.CTkFrame):
         self.name_label = ctk.CTkLabel(
             top_row,
             text=f"📄 {filepath.name}",
-            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+            font=_font(13, "bold", family="Segoe UI"),
             text_color=Colors.TEXT_PRIMARY,
             anchor="w",
         )
@@ -174,7 +267,7 @@ class SearchResultItem(ctk.CTkFrame):
         self.time_label = ctk.CTkLabel(
             top_row,
             text=time_str,
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=_font(11, family="Segoe UI"),
             text_color=Colors.TEXT_MUTED,
             anchor="e",
         )
@@ -184,7 +277,7 @@ class SearchResultItem(ctk.CTkFrame):
         self.context_label = ctk.CTkLabel(
             self.content_frame,
             text=f"...{match_context}...",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
             anchor="w",
             wraplength=500,
@@ -212,10 +305,58 @@ class SearchResultItem(ctk.CTkFrame):
 # ========================================
 # History Item Widget
 # ========================================
+# Preview cache: path -> (mtime, time_str, preview), LRU-bounded so
+# re-rendering the history list skips re-reading unchanged files
+_PREVIEW_CACHE: "OrderedDict[str, Tuple[int, str, str]]" = OrderedDict()
+_PREVIEW_CACHE_SIZE = 512
+
+
+def _read_history_preview(filepath: Path) -> str:
+    """Return the first content line of a history file, truncated to 80 chars"""
+    preview = ""
+    try:
+        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped and not line.startswith(("#", ">", "---")):
+                    preview = stripped[:80]
+                    if len(stripped) > 80:
+                        preview += "..."
+                    break
+    except OSError:
+        preview = "无法读取内容"
+    return preview
+
+
+def _history_info(filepath: Path, mtime: Optional[float] = None) -> Tuple[str, str]:
+    """Return (time_str, preview) for a history file, cached by mtime
+    
+    Pass the mtime when the caller already has it to skip the stat() call.
+    """
+    key = str(filepath)
+    if mtime is None:
+        mtime = filepath.stat().st_mtime
+    cached = _PREVIEW_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        _PREVIEW_CACHE.move_to_end(key)
+        return cached[1], cached[2]
+    
+    time_str = datetime.fromtimestamp(mtime).strftime("%H:%M")
+    preview = _read_history_preview(filepath)
+    _PREVIEW_CACHE[key] = (mtime, time_str, preview)
+    if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+        _PREVIEW_CACHE.popitem(last=False)
+    return time_str, preview
+
+
 class HistoryItem(ctk.CTkFrame):
     """History list item showing file info"""
     
-    def __init__(self, parent, filepath: Path, on_click=None, on_delete=None, **kwargs):
+    # The card currently showing its hover state (at most one)
+    _hovered_item: Optional["HistoryItem"] = None
+    
+    def __init__(self, parent, filepath: Path, on_click=None, on_delete=None,
+                 mtime: Optional[float] = None, **kwargs):
         super().__init__(parent, fg_color=Colors.CONTENT_CARD, corner_radius=16, border_width=1, border_color=Colors.CONTENT_BORDER, **kwargs)
         
         self.filepath = filepath
@@ -226,58 +367,41 @@ class HistoryItem(ctk.CTkFrame):
         
         # Configure
         self.configure(height=70, cursor="hand2")
-        self.pack_propagate(False)
-        
-        # Parse file info
-        filename = filepath.name
-        mod_time = datetime.fromtimestamp(filepath.stat().st_mtime)
-        time_str = mod_time.strftime("%H:%M")
-        date_str = mod_time.strftime("%Y-%m-%d")
+        # Single-frame grid layout: labels in column 0, delete button in
+        # column 1 (no nested content frame)
+        self.grid_propagate(False)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
         
-        # Try to read first line of content
-        preview = ""
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                for line in lines:
-                    if line.strip() and not line.startswith("#") and not line.startswith(">") and not line.startswith("---"):
-                        preview = line.strip()[:80]
-                        if len(line.strip()) > 80:
-                            preview += "..."
-                        break
-        except:
-            preview = "无法读取内容"
-            
-        # Left content
-        self.left_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.left_frame.pack(side="left", fill="both", expand=True, padx=15, pady=10)
+        # Parse file info and first line of content (cached per mtime)
+        time_str, preview = _history_info(filepath, mtime)
         
         # Time label
         self.time_label = ctk.CTkLabel(
-            self.left_frame,
+            self,
             text=time_str,
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
             anchor="w",
         )
-        self.time_label.pack(anchor="w")
+        self.time_label.grid(row=0, column=0, sticky="w", padx=15, pady=(10, 0))
         
         # Preview text
         self.preview_label = ctk.CTkLabel(
-            self.left_frame,
+            self,
             text=preview if preview else "空文件",
-            font=ctk.CTkFont(family="Segoe UI", size=14),
+            font=_font(14, family="Segoe UI"),
             text_color=Colors.TEXT_PRIMARY if preview else Colors.TEXT_MUTED,
             anchor="w",
             wraplength=450,
         )
-        self.preview_label.pack(anchor="w", pady=(3, 0))
+        self.preview_label.grid(row=1, column=0, sticky="nw", padx=15, pady=(3, 10))
         
-        # Delete button - not packed initially, shown on hover
+        # Delete button - not gridded initially, shown on hover
         self._delete_btn = ctk.CTkButton(
             self,
             text="🗑️",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             width=35,
             height=35,
             corner_radius=17,
@@ -286,16 +410,19 @@ class HistoryItem(ctk.CTkFrame):
             text_color=Colors.TEXT_MUTED,
             command=self._on_delete_click,
         )
-        # Don't pack initially - will be shown on hover
-        
-        # Bind click events to left content area only (not delete button)
-        for widget in [self, self.left_frame, self.time_label, self.preview_label]:
-            widget.bind("<Button-1>", self._on_click)
-        
-        # Bind hover events to main widgets
-        for widget in [self, self.left_frame, self.time_label, self.preview_label]:
-            widget.bind("<Enter>", self._on_enter)
-            widget.bind("<Leave>", self._on_leave)
+        # Don't grid initially - will be shown on hover
+        
+        # Click and hover events on the content area (clicks exclude the
+        # delete button, which only needs hover so the card stays highlighted)
+        _bind_via_tag(HistoryItem, "EchoLogHistoryItem", [self, self.time_label, self.preview_label], {
+            "<Button-1>": "_on_click",
+            "<Enter>": "_on_enter",
+            "<Leave>": "_on_leave",
+        })
+        _bind_via_tag(HistoryItem, "EchoLogHistoryItemHover", [self._delete_btn], {
+            "<Enter>": "_on_enter",
+            "<Leave>": "_on_leave",
+        })
             
     def _is_mouse_inside(self, event):
         """Check if mouse is still inside the card area"""
@@ -318,42 +445,44 @@ class HistoryItem(ctk.CTkFrame):
     def _on_enter(self, event):
         if self._is_hovered:
             return
+        # Only one card is highlighted at a time; un-hover the previous one
+        # in case its <Leave> was missed
+        previous = HistoryItem._hovered_item
+        if previous is not None and previous is not self:
+            try:
+                previous._hide_hover()
+            except Exception:
+                pass  # Previous card was destroyed by a list refresh
+        HistoryItem._hovered_item = self
+        
         self._is_hovered = True
         self.configure(fg_color="#F5F5F5")
         if self._delete_btn:
-            self._delete_btn.pack(side="right", padx=10)
-            # Bind hover events to delete button too
-            self._delete_btn.bind("<Enter>", self._on_enter)
-            self._delete_btn.bind("<Leave>", self._on_leave)
+            self._delete_btn.grid(row=0, column=1, rowspan=2, padx=10)
         
     def _on_leave(self, event):
-        # Schedule the check after a short delay to handle mouse moving between widgets
-        self.after(50, lambda: self._check_mouse_left(event))
-    
-    def _check_mouse_left(self, event):
-        """Check if mouse has actually left the card area"""
+        # <Leave> also fires when the pointer moves onto one of our own child
+        # widgets; one winfo_containing lookup tells the two cases apart
         try:
-            # Get current mouse position
-            mouse_x = self.winfo_pointerx()
-            mouse_y = self.winfo_pointery()
-            
-            # Get card bounds
-            x = self.winfo_rootx()
-            y = self.winfo_rooty()
-            w = self.winfo_width()
-            h = self.winfo_height()
-            
-            # Check if mouse is inside
-            if x <= mouse_x <= x + w and y <= mouse_y <= y + h:
-                return  # Mouse still inside, don't hide
-        except:
-            pass
-        
-        # Mouse left the card
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except Exception:
+            widget = None
+        # Match the card itself or a descendant path (".!historyitem1." must not
+        # match a sibling like ".!historyitem10")
+        if widget is not None and (widget == self or str(widget).startswith(str(self) + ".")):
+            return
+        self._hide_hover()
+    
+    def _hide_hover(self):
+        """Remove the hover highlight and hide the delete button"""
+        if HistoryItem._hovered_item is self:
+            HistoryItem._hovered_item = None
+        if not self._is_hovered:
+            return
         self._is_hovered = False
         self.configure(fg_color=Colors.CONTENT_CARD)
         if self._delete_btn:
-            self._delete_btn.pack_forget()
+            self._delete_btn.grid_remove()
         
     def _on_click(self, event):
         if self.on_click:
@@ -362,6 +491,185 @@ class HistoryItem(ctk.CTkFrame):
     def _on_delete_click(self):
         if self.on_delete:
             self.on_delete(self.filepath)
+            
+    def rebind(self, filepath: Path, mtime: Optional[float] = None):
+        """Point a recycled card at another history file"""
+        self._hide_hover()
+        self.filepath = filepath
+        time_str, preview = _history_info(filepath, mtime)
+        self.time_label.configure(text=time_str)
+        self.preview_label.configure(
+            text=preview if preview else "空文件",
+            text_color=Colors.TEXT_PRIMARY if preview else Colors.TEXT_MUTED,
+        )
+
+
+class HistoryList(ctk.CTkFrame):
+    """Virtualized history list - widgets exist only for rows in the viewport
+    
+    Rows are ("header", date_str) or ("item", (path, mtime)). Date headers
+    are plain canvas text items rather than widgets. Rows that scroll out
+    of view are hidden and pooled per kind, then rebound to the rows that
+    scroll in, so the widget count follows the viewport height instead of
+    the number of history files.
+    """
+    
+    # Row heights (unscaled) matching the old packed layout
+    HEADER_HEIGHT = 51  # 28px label + pady=(15, 8)
+    HEADER_TOP = 15
+    HEADER_TEXT_MIDDLE = 14  # vertical centre of the old 28px label
+    ITEM_HEIGHT = 76    # 70px card + pady=3
+    ITEM_TOP = 3
+    # Extra rows rendered above/below the viewport
+    OVERSCAN = 2
+    
+    def __init__(self, parent, on_click=None, on_delete=None, **kwargs):
+        super().__init__(parent, fg_color="transparent", corner_radius=0, **kwargs)
+        
+        self.on_click = on_click
+        self.on_delete = on_delete
+        self._rows: List[Tuple[str, object]] = []
+        self._row_tops: List[int] = []
+        self._content_height = 0
+        # Headers have no widget: their entries hold None and a text item id
+        self._visible = {}  # row index -> (kind, widget, canvas item id)
+        self._pool = {"header": [], "item": []}  # hidden (widget, canvas item id)
+        
+        self._canvas = ctk.CTkCanvas(
+            self,
+            bg=Colors.CONTENT_BG,
+            highlightthickness=0,
+            yscrollincrement=1,
+        )
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._canvas.yview)
+        self._scrollbar.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True)
+        self._canvas.configure(yscrollcommand=self._on_yscroll)
+        
+        self._canvas.bind("<Configure>", self._on_configure)
+        # Bound app-wide like CTkScrollableFrame; filtered to our canvas
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        
+    def set_rows(self, rows: List[Tuple[str, object]]):
+        """Replace the list contents and redraw the visible rows"""
+        for index in list(self._visible):
+            self._release(index)
+            
+        header_h = round(self._apply_widget_scaling(self.HEADER_HEIGHT))
+        item_h = round(self._apply_widget_scaling(self.ITEM_HEIGHT))
+        self._rows = rows
+        self._row_tops = []
+        y = 0
+        for kind, _ in rows:
+            self._row_tops.append(y)
+            y += header_h if kind == "header" else item_h
+        self._content_height = y
+        
+        self._canvas.configure(scrollregion=(0, 0, self._canvas.winfo_width(), y))
+        self._render()
+        
+    def _render(self):
+        """Show the rows intersecting the viewport, recycle the rest"""
+        top = self._canvas.canvasy(0)
+        bottom = top + self._canvas.winfo_height()
+        first = max(bisect.bisect_right(self._row_tops, top) - 1 - self.OVERSCAN, 0)
+        last = min(bisect.bisect_left(self._row_tops, bottom) + self.OVERSCAN, len(self._rows))
+        
+        for index in [i for i in self._visible if not first <= i < last]:
+            self._release(index)
+        for index in range(first, last):
+            if index not in self._visible:
+                try:
+                    self._show_row(index)
+                except Exception as e:
+                    print(f"[ERROR] Failed to create item for {self._rows[index][1]}: {e}")
+                    
+    def _show_row(self, index: int):
+        """Bind a pooled (or new) widget to a row and place it"""
+        kind, value = self._rows[index]
+        top = self.HEADER_TOP + self.HEADER_TEXT_MIDDLE if kind == "header" else self.ITEM_TOP
+        y = self._row_tops[index] + round(self._apply_widget_scaling(top))
+        
+        if kind == "item":
+            # Path objects are only built for rows that are actually shown
+            path, mtime = value
+            filepath = Path(path)
+            
+        pool = self._pool[kind]
+        if pool:
+            widget, window = pool.pop()
+            if kind == "header":
+                self._canvas.itemconfigure(window, text=value)
+            else:
+                widget.rebind(filepath, mtime)
+            self._canvas.coords(window, 0, y)
+            self._canvas.itemconfigure(window, state="normal")
+        else:
+            if kind == "header":
+                widget = None
+                window = self._canvas.create_text(
+                    0, y,
+                    text=value,
+                    font=self._apply_font_scaling(_font(13, family="Segoe UI")),
+                    fill=Colors.TEXT_SECONDARY,
+                    anchor="w",
+                )
+            else:
+                widget = HistoryItem(
+                    self._canvas,
+                    filepath,
+                    on_click=self.on_click,
+                    on_delete=self.on_delete,
+                    mtime=mtime,
+                )
+                window = self._canvas.create_window(
+                    0, y, window=widget, anchor="nw", width=self._canvas.winfo_width()
+                )
+        self._visible[index] = (kind, widget, window)
+        
+    def _release(self, index: int):
+        """Hide a row's widget and return it to the pool"""
+        kind, widget, window = self._visible.pop(index)
+        if kind == "item":
+            widget._hide_hover()
+        self._canvas.itemconfigure(window, state="hidden")
+        self._pool[kind].append((widget, window))
+        
+    def _on_configure(self, event):
+        # Item cards span the full canvas width
+        for kind, _, window in self._visible.values():
+            if kind == "item":
+                self._canvas.itemconfigure(window, width=event.width)
+        for _, window in self._pool["item"]:
+            self._canvas.itemconfigure(window, width=event.width)
+        self._canvas.configure(scrollregion=(0, 0, event.width, self._content_height))
+        self._render()
+        
+    def _on_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        self._render()
+        
+    def _on_mousewheel(self, event):
+        if not (str(event.widget) + ".").startswith(str(self._canvas) + "."):
+            return
+        if self._canvas.yview() == (0.0, 1.0):
+            return
+        self._canvas.yview_scroll(-int(event.delta / 6), "units")
+
+
+# ========================================
+# Page Widgets
+# ========================================
+@dataclass(slots=True)
+class HomeWidgets:
+    """Widgets of the home page that recording callbacks update"""
+    status_dot: ctk.CTkLabel
+    status_label: ctk.CTkLabel
+    file_indicator: ctk.CTkLabel
+    text_display: ctk.CTkTextbox
+    pause_btn: ctk.CTkButton
+    record_btn: ctk.CTkButton
+    stop_btn: ctk.CTkButton
 
 
 # ========================================
@@ -372,6 +680,8 @@ class EchoLogApp(ctk.CTk):
     
     def __init__(self):
         super().__init__()
+        # Stay hidden while the UI is built so the layout is solved once
+        self.withdraw()
         
         # ========================================
         # Window Setup
@@ -389,13 +699,27 @@ class EchoLogApp(ctk.CTk):
         # ========================================
         self._is_recording = False
         self._is_paused = False
-        self._engine: Optional[TranscriptionEngine] = None
+        self._engine: Optional['TranscriptionEngine'] = None
         self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self._async_thread: Optional[threading.Thread] = None
+        # The running recording session on the engine loop
+        self._session: Optional["concurrent.futures.Future"] = None
+        # Set while not paused; lives on the engine loop, see _signal_resume
+        self._resume_event: Optional[asyncio.Event] = None
         self._current_interim_text = ""
+        # Latest interim partial not yet drawn (written by the engine thread)
+        self._pending_interim: Optional[str] = None
+        self._interim_flush_scheduled = False
+        self._autoscroll_pending = False
         self._output_file: Optional[str] = None
+        # Header-only handle, handed to the engine to append to for the session
+        self._output_fp = None
         self._current_page = "home"
         self._nav_items = {}
+        # History list staleness: set by writes from this app, and compared
+        # against the output dir's (path, mtime) stamp for outside changes
+        self._history_dirty = True
+        self._history_stamp = None
         
         # ========================================
         # Build UI
@@ -407,6 +731,8 @@ class EchoLogApp(ctk.CTk):
         
         # Show home page by default
         self._show_page("home")
+        self.update_idletasks()
+        self.deiconify()
         
     def _build_ui(self):
         """Build the main UI layout"""
@@ -431,26 +757,26 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             logo_frame,
             text="🎙️ EchoLog",
-            font=ctk.CTkFont(family="Segoe UI", size=20, weight="bold"),
+            font=_font(20, "bold", family="Segoe UI"),
             text_color="#FFFFFF",
         ).pack(side="left", padx=20)
         
         # Navigation items
         self._nav_items["home"] = NavItem(
             self._sidebar, "🏠", "首页",
-            command=lambda: self._show_page("home")
+            command=functools.partial(self._show_page, "home")
         )
         self._nav_items["home"].pack(fill="x", pady=4, padx=10) # Add horizontal padding
         
         self._nav_items["history"] = NavItem(
             self._sidebar, "📜", "历史记录",
-            command=lambda: self._show_page("history")
+            command=functools.partial(self._show_page, "history")
         )
         self._nav_items["history"].pack(fill="x", pady=4, padx=10)
         
         self._nav_items["settings"] = NavItem(
             self._sidebar, "⚙️", "设置",
-            command=lambda: self._show_page("settings")
+            command=functools.partial(self._show_page, "settings")
         )
         self._nav_items["settings"].pack(fill="x", pady=4, padx=10)
         
@@ -462,7 +788,7 @@ class EchoLogApp(ctk.CTk):
         self._path_label = ctk.CTkLabel(
             bottom_frame,
             text=f"📁 {self._get_short_path()}",
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=_font(11, family="Segoe UI"),
             text_color=Colors.SIDEBAR_TEXT,
             wraplength=160,
         )
@@ -472,7 +798,7 @@ class EchoLogApp(ctk.CTk):
         open_folder_btn = ctk.CTkButton(
             bottom_frame,
             text="📂 打开文件夹",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color=Colors.SIDEBAR_HOVER,
             hover_color=Colors.SIDEBAR_ACTIVE,
             height=40,
@@ -490,11 +816,14 @@ class EchoLogApp(ctk.CTk):
         self._content_area = ctk.CTkFrame(self, fg_color=Colors.CONTENT_BG, corner_radius=0)
         self._content_area.grid(row=0, column=1, sticky="nsew")
         
-        # Create page frames
+        # Create page frames (history/settings are built on first visit)
+        self._page_factories = {
+            "home": self._create_home_page,
+            "history": self._create_history_page,
+            "settings": self._create_settings_page,
+        }
         self._pages = {}
         self._pages["home"] = self._create_home_page()
-        self._pages["history"] = self._create_history_page()
-        self._pages["settings"] = self._create_settings_page()
         
     def _get_short_path(self) -> str:
         """Get shortened path for display"""
@@ -503,6 +832,50 @@ class EchoLogApp(ctk.CTk):
             return "..." + path[-22:]
         return path
         
+    def _make_title(self, parent, text: str) -> ctk.CTkFrame:
+        """Build a page title bar; callers pack extra widgets on its right"""
+        title_frame = ctk.CTkFrame(parent, fg_color="transparent", height=60)
+        title_frame.pack(fill="x", padx=30, pady=(30, 20))
+        
+        ctk.CTkLabel(
+            title_frame,
+            text=text,
+            font=_font(24, "bold", family="Segoe UI"),
+            text_color=Colors.TEXT_PRIMARY,
+        ).pack(side="left")
+        return title_frame
+        
+    def _make_setting_card(self, parent, title: str, subtitle: str) -> Tuple[ctk.CTkFrame, ctk.CTkLabel]:
+        """Build a settings row card
+        
+        Returns (inner, subtitle_label); callers pack their control on the
+        right of inner.
+        """
+        card = ctk.CTkFrame(parent, fg_color=Colors.CONTENT_CARD, corner_radius=16, border_width=1, border_color=Colors.CONTENT_BORDER)
+        card.pack(fill="x", pady=5)
+        
+        inner = ctk.CTkFrame(card, fg_color="transparent")
+        inner.pack(fill="x", padx=20, pady=15)
+        
+        left = ctk.CTkFrame(inner, fg_color="transparent")
+        left.pack(side="left", fill="x", expand=True)
+        
+        ctk.CTkLabel(
+            left,
+            text=title,
+            font=_font(14, "bold", family="Segoe UI"),
+            text_color=Colors.TEXT_PRIMARY,
+        ).pack(anchor="w")
+        
+        subtitle_label = ctk.CTkLabel(
+            left,
+            text=subtitle,
+            font=_font(12, family="Segoe UI"),
+            text_color=Colors.TEXT_SECONDARY,
+        )
+        subtitle_label.pack(anchor="w", pady=(3, 0))
+        return inner, subtitle_label
+        
     # ========================================
     # Home Page (Recording)
     # ========================================
@@ -512,72 +885,69 @@ class EchoLogApp(ctk.CTk):
         page = ctk.CTkFrame(self._content_area, fg_color=Colors.CONTENT_BG)
         
         # Title
-        title_frame = ctk.CTkFrame(page, fg_color="transparent", height=60)
-        title_frame.pack(fill="x", padx=30, pady=(30, 20))
-        
-        ctk.CTkLabel(
-            title_frame,
-            text="实时听写",
-            font=ctk.CTkFont(family="Segoe UI", size=24, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(side="left")
+        title_frame = self._make_title(page, "实时听写")
         
         # Status indicator (Pill shape)
-        self._status_frame = ctk.CTkFrame(title_frame, fg_color=Colors.ACCENT_LIGHT, corner_radius=15, height=30)
-        self._status_frame.pack(side="right")
-        self._status_frame.pack_propagate(False) # Fixed height for pill look
-        self._status_frame.configure(width=100)  # Initial width
+        status_frame = ctk.CTkFrame(title_frame, fg_color=Colors.ACCENT_LIGHT, corner_radius=15, height=30)
+        status_frame.pack(side="right")
+        status_frame.pack_propagate(False) # Fixed height for pill look
+        status_frame.configure(width=100)  # Initial width
         
-        inner_status = ctk.CTkFrame(self._status_frame, fg_color="transparent")
+        inner_status = ctk.CTkFrame(status_frame, fg_color="transparent")
         inner_status.pack(expand=True, fill="both", padx=10)
         
-        self._status_dot = ctk.CTkLabel(
+        status_dot = ctk.CTkLabel(
             inner_status,
             text="●",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=Colors.SUCCESS,
         )
-        self._status_dot.pack(side="left", padx=(0, 5))
+        status_dot.pack(side="left", padx=(0, 5))
         
-        self._status_label = ctk.CTkLabel(
+        status_label = ctk.CTkLabel(
             inner_status,
             text="就绪",
-            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+            font=_font(13, "bold", family="Segoe UI"),
             text_color=Colors.ACCENT,
         )
-        self._status_label.pack(side="left")
+        status_label.pack(side="left")
         
         # Text display card
         text_card = ctk.CTkFrame(page, fg_color=Colors.CONTENT_CARD, corner_radius=20, border_width=1, border_color=Colors.CONTENT_BORDER)
         text_card.pack(fill="both", expand=True, padx=30, pady=(0, 20))
         
         # Current file indicator
-        self._file_indicator = ctk.CTkLabel(
+        file_indicator = ctk.CTkLabel(
             text_card,
             text="📄 点击「开始录音」创建新文件",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_MUTED,
         )
-        self._file_indicator.pack(anchor="w", padx=20, pady=(15, 5))
+        file_indicator.pack(anchor="w", padx=20, pady=(15, 5))
         
         # Text display
-        self._text_display = ctk.CTkTextbox(
+        text_display = ctk.CTkTextbox(
             text_card,
-            font=ctk.CTkFont(family="Segoe UI", size=15),
+            font=_font(15, family="Segoe UI"),
             wrap="word",
-            state="disabled",
             fg_color=Colors.CONTENT_CARD,
             text_color=Colors.TEXT_PRIMARY,
             corner_radius=0,
             border_width=0,
         )
-        self._text_display.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        text_display.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        _make_read_only(text_display)
         
         # Configure text tags
-        self._text_display.tag_config("interim", foreground=Colors.TEXT_MUTED)
-        self._text_display.tag_config("final", foreground=Colors.TEXT_PRIMARY)
-        self._text_display.tag_config("timestamp", foreground=Colors.ACCENT)
-        self._text_display.tag_config("system", foreground=Colors.WARNING)
+        text_display.tag_config("interim", foreground=Colors.TEXT_MUTED)
+        text_display.tag_config("final", foreground=Colors.TEXT_PRIMARY)
+        text_display.tag_config("timestamp", foreground=Colors.ACCENT)
+        text_display.tag_config("system", foreground=Colors.WARNING)
+        # The interim line sits between these marks; left gravity keeps text
+        # inserted at a mark outside the range it delimits
+        for mark in ("interim_start", "interim_end"):
+            text_display.mark_set(mark, "1.0")
+            text_display.mark_gravity(mark, "left")
         
         # Control buttons container (Centered bottom)
         control_container = ctk.CTkFrame(page, fg_color="transparent")
@@ -588,10 +958,10 @@ class EchoLogApp(ctk.CTk):
         center_frame.pack(expand=True)
         
         # Pause button (Left pill)
-        self._pause_btn = ctk.CTkButton(
+        pause_btn = ctk.CTkButton(
             center_frame,
             text="⏸️",
-            font=ctk.CTkFont(size=20),
+            font=_font(20),
             width=60,
             height=60,
             corner_radius=30,
@@ -603,14 +973,14 @@ class EchoLogApp(ctk.CTk):
             state="disabled",
             command=self._toggle_pause,
         )
-        self._pause_btn.pack(side="left", padx=20)
+        pause_btn.pack(side="left", padx=20)
         
         # Main Record Button (Big Center Circle)
         # Using a large size and radius to make it distinct
-        self._record_btn = ctk.CTkButton(
+        record_btn = ctk.CTkButton(
             center_frame,
             text="🎙️",
-            font=ctk.CTkFont(size=32),
+            font=_font(32),
             width=80,
             height=80,
             corner_radius=40,
@@ -619,13 +989,13 @@ class EchoLogApp(ctk.CTk):
             text_color="#FFFFFF",
             command=self._toggle_recording,
         )
-        self._record_btn.pack(side="left", padx=20)
+        record_btn.pack(side="left", padx=20)
         
         # Stop button (Right pill)
-        self._stop_btn = ctk.CTkButton(
+        stop_btn = ctk.CTkButton(
             center_frame,
             text="⏹️",
-            font=ctk.CTkFont(size=20),
+            font=_font(20),
             width=60,
             height=60,
             corner_radius=30,
@@ -635,7 +1005,17 @@ class EchoLogApp(ctk.CTk):
             state="disabled",
             command=self._stop_recording,
         )
-        self._stop_btn.pack(side="left", padx=20)
+        stop_btn.pack(side="left", padx=20)
+        
+        self._home = HomeWidgets(
+            status_dot=status_dot,
+            status_label=status_label,
+            file_indicator=file_indicator,
+            text_display=text_display,
+            pause_btn=pause_btn,
+            record_btn=record_btn,
+            stop_btn=stop_btn,
+        )
         
         return page
         
@@ -648,15 +1028,7 @@ class EchoLogApp(ctk.CTk):
         page = ctk.CTkFrame(self._content_area, fg_color=Colors.CONTENT_BG)
         
         # Title
-        title_frame = ctk.CTkFrame(page, fg_color="transparent", height=60)
-        title_frame.pack(fill="x", padx=30, pady=(30, 20))
-        
-        ctk.CTkLabel(
-            title_frame,
-            text="历史记录",
-            font=ctk.CTkFont(family="Segoe UI", size=24, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(side="left")
+        title_frame = self._make_title(page, "历史记录")
         
         # Button bar
         btn_bar = ctk.CTkFrame(title_frame, fg_color="transparent")
@@ -666,7 +1038,7 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkButton(
             btn_bar,
             text="📂 导入",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             width=80,
             height=32,
             corner_radius=16,
@@ -680,7 +1052,7 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkButton(
             btn_bar,
             text="🔄 刷新",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             width=80,
             height=32,
             corner_radius=16,
@@ -703,14 +1075,14 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             info_inner,
             text="🔒 您的数据保持私密",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+            font=_font(14, "bold", family="Segoe UI"),
             text_color=Colors.TEXT_PRIMARY,
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             info_inner,
             text="所有听写记录仅保存在本地，不会上传到云端。音频不会被保存，只保留文字记录。",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
         ).pack(anchor="w", pady=(5, 0))
         
@@ -728,7 +1100,7 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             search_container,
             text="🔍",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=Colors.TEXT_MUTED,
         ).pack(side="left", padx=(15, 5), pady=8)
         
@@ -737,7 +1109,7 @@ class EchoLogApp(ctk.CTk):
         self._search_entry = ctk.CTkEntry(
             search_container,
             placeholder_text="搜索关键词...",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             textvariable=self._search_var,
             fg_color="transparent",
             border_width=0,
@@ -751,7 +1123,7 @@ class EchoLogApp(ctk.CTk):
         self._search_clear_btn = ctk.CTkButton(
             search_container,
             text="✕",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             width=30,
             height=30,
             corner_radius=15,
@@ -766,7 +1138,7 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkButton(
             search_frame,
             text="🔎 搜索",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             width=80,
             height=40,
             corner_radius=20,
@@ -780,7 +1152,7 @@ class EchoLogApp(ctk.CTk):
         self._search_count_label = ctk.CTkLabel(
             page,
             text="",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_MUTED,
         )
         # Don't pack initially - will show when searching
@@ -789,77 +1161,103 @@ class EchoLogApp(ctk.CTk):
         self._is_searching = False
         self._search_results = []
         
-        # Scrollable history list
+        # History list area: a virtualized list for the history rows, a
+        # plain scroll frame for search results and a reusable empty label
+        self._history_body = ctk.CTkFrame(page, fg_color="transparent", corner_radius=0)
+        self._history_body.pack(fill="both", expand=True, padx=30, pady=(0, 20))
+        
+        self._history_list = HistoryList(
+            self._history_body,
+            on_click=self._open_file,
+            on_delete=self._delete_file,
+        )
         self._history_scroll = ctk.CTkScrollableFrame(
-            page,
+            self._history_body,
             fg_color="transparent",
             corner_radius=0,
         )
-        self._history_scroll.pack(fill="both", expand=True, padx=30, pady=(0, 20))
+        self._history_empty_label = ctk.CTkLabel(
+            self._history_body,
+            text="暂无历史记录",
+            font=_font(14, family="Segoe UI"),
+            text_color=Colors.TEXT_MUTED,
+        )
         
         return page
         
+    def _history_dir_stamp(self) -> tuple:
+        """(path, mtime_ns) of the output dir; changes on file add/remove/rename"""
+        output_dir = OutputConfig.OUTPUT_DIR
+        try:
+            return (str(output_dir), output_dir.stat().st_mtime_ns)
+        except OSError:
+            return (str(output_dir), None)
+            
+    def _history_needs_refresh(self) -> bool:
+        """Whether the history list may be out of date"""
+        return self._history_dirty or self._history_dir_stamp() != self._history_stamp
+        
     def _refresh_history(self):
         """Refresh the history list"""
-        # Clear existing items
+        self._history_dirty = False
+        self._history_stamp = self._history_dir_stamp()
+        
+        # Free any previous search results
         for widget in self._history_scroll.winfo_children():
             widget.destroy()
             
         # Get all output files
         output_dir = OutputConfig.OUTPUT_DIR
         if not output_dir.exists():
-            ctk.CTkLabel(
-                self._history_scroll,
-                text="暂无历史记录",
-                font=ctk.CTkFont(family="Segoe UI", size=14),
-                text_color=Colors.TEXT_MUTED,
-            ).pack(pady=50)
+            self._show_history_view(self._history_empty_label)
             return
             
-        files_md = sorted(output_dir.glob("*.md"), key=lambda x: x.stat().st_mtime, reverse=True)
-        files_txt = sorted(output_dir.glob("*.txt"), key=lambda x: x.stat().st_mtime, reverse=True)
-        files = sorted(files_md + files_txt, key=lambda x: x.stat().st_mtime, reverse=True)
-        
-        if not files:
-            ctk.CTkLabel(
-                self._history_scroll,
-                text="暂无历史记录",
-                font=ctk.CTkFont(family="Segoe UI", size=14),
-                text_color=Colors.TEXT_MUTED,
-            ).pack(pady=50)
+        # One directory pass; the mtime is reused for sorting, grouping and
+        # the card itself
+        entries = []
+        try:
+            with os.scandir(output_dir) as it:
+                for entry in it:
+                    if not OutputConfig.is_recording_file(entry.name):
+                        continue
+                    try:
+                        if entry.is_file():
+                            entries.append((entry.path, entry.stat().st_mtime))
+                    except OSError as e:
+                        print(f"[ERROR] Failed to create item for {entry.path}: {e}")
+        except OSError as e:
+            print(f"[ERROR] Failed to list {output_dir}: {e}")
+        entries.sort(key=operator.itemgetter(1), reverse=True)
+        
+        if not entries:
+            self._show_history_view(self._history_empty_label)
             return
             
-        # Group by date
+        # Group by date; widgets are only created for rows in view
+        rows = []
         current_date = None
-        for filepath in files:
-            try:
-                mod_time = datetime.fromtimestamp(filepath.stat().st_mtime)
-                date_str = mod_time.strftime("%Y年%m月%d日")
-                
-                # Check if we need a new date header
-                if date_str != current_date:
-                    current_date = date_str
-                    
-                    # Date header
-                    date_label = ctk.CTkLabel(
-                        self._history_scroll,
-                        text=date_str,
-                        font=ctk.CTkFont(family="Segoe UI", size=13),
-                        text_color=Colors.TEXT_SECONDARY,
-                        anchor="w",
-                    )
-                    date_label.pack(fill="x", pady=(15, 8))
-                    
-                # File item
-                item = HistoryItem(
-                    self._history_scroll,
-                    filepath,
-                    on_click=self._open_file,
-                    on_delete=self._delete_file,
-                )
-                item.pack(fill="x", pady=3)
-            except Exception as e:
-                print(f"[ERROR] Failed to create item for {filepath}: {e}")
+        for path, mtime in entries:
+            date_str = datetime.fromtimestamp(mtime).strftime("%Y年%m月%d日")
+            
+            # Check if we need a new date header
+            if date_str != current_date:
+                current_date = date_str
+                rows.append(("header", date_str))
+            rows.append(("item", (path, mtime)))
+            
+        self._history_list.set_rows(rows)
+        self._show_history_view(self._history_list)
+        
+    def _show_history_view(self, view):
+        """Show one of the history list, search results or empty-state views"""
+        for other in (self._history_list, self._history_scroll, self._history_empty_label):
+            if other is not view:
+                other.pack_forget()
+        if not view.winfo_manager():
+            if view is self._history_empty_label:
+                view.pack(pady=50)
+            else:
+                view.pack(fill="both", expand=True)
             
     def _open_file(self, filepath: Path):
         """Open a file with default application"""
@@ -884,6 +1282,12 @@ class EchoLogApp(ctk.CTk):
                 
     def _import_files(self):
         """Import external MD/TXT files"""
+        # The native dialog holds the Tk thread, which stalls the engine's
+        # UI callbacks; pause a live recording until it closes
+        auto_paused = self._is_recording and not self._is_paused
+        if auto_paused:
+            self._pause_recording()
+            
         filepaths = filedialog.askopenfilenames(
             title="选择要导入的文件",
             initialdir=str(Path.home() / "Documents"),
@@ -894,10 +1298,16 @@ class EchoLogApp(ctk.CTk):
             ]
         )
         
+        if auto_paused:
+            self._resume_recording()
+        
         if not filepaths:
             return
             
-        imported_count = 0
+        # Pick destination names here; names reserved earlier in this batch
+        # count as taken since the copies haven't happened yet
+        plan = []
+        reserved = set()
         for src_path in filepaths:
             src_path = Path(src_path)
             # Copy to output directory
@@ -905,19 +1315,33 @@ class EchoLogApp(ctk.CTk):
             
             # Handle duplicate names
             counter = 1
-            while dest_path.exists():
+            while dest_path.exists() or dest_path in reserved:
                 stem = src_path.stem
                 suffix = src_path.suffix
                 dest_path = OutputConfig.OUTPUT_DIR / f"{stem}_{counter}{suffix}"
                 counter += 1
-                
-            try:
-                import shutil
-                shutil.copy2(src_path, dest_path)
-                imported_count += 1
-            except Exception as e:
-                messagebox.showerror("导入失败", f"无法导入 {src_path.name}: {e}")
-                
+            reserved.add(dest_path)
+            plan.append((src_path, dest_path))
+            
+        # Copy in a background thread so large files don't block the UI
+        def do_copy():
+            imported_count = 0
+            errors = []
+            for src_path, dest_path in plan:
+                try:
+                    shutil.copy2(src_path, dest_path)
+                    imported_count += 1
+                except Exception as e:
+                    errors.append((src_path.name, e))
+            self.after(0, self._handle_import_result, imported_count, errors)
+            
+        threading.Thread(target=do_copy, daemon=True).start()
+        
+    def _handle_import_result(self, imported_count: int, errors: list):
+        """Report the outcome of a background import"""
+        for name, e in errors:
+            messagebox.showerror("导入失败", f"无法导入 {name}: {e}")
+            
         if imported_count > 0:
             self._refresh_history()
             messagebox.showinfo("导入成功", f"成功导入 {imported_count} 个文件")
@@ -965,6 +1389,7 @@ class EchoLogApp(ctk.CTk):
         # Clear existing items
         for widget in self._history_scroll.winfo_children():
             widget.destroy()
+        self._show_history_view(self._history_scroll)
         
         # Get all output files
         output_dir = OutputConfig.OUTPUT_DIR
@@ -1060,7 +1485,7 @@ class EchoLogApp(ctk.CTk):
                     date_label = ctk.CTkLabel(
                         self._history_scroll,
                         text=date_str,
-                        font=ctk.CTkFont(family="Segoe UI", size=13),
+                        font=_font(13, family="Segoe UI"),
                         text_color=Colors.TEXT_SECONDARY,
                         anchor="w",
                     )
@@ -1087,21 +1512,21 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             no_result_frame,
             text="🔍",
-            font=ctk.CTkFont(size=48),
+            font=_font(48),
             text_color=Colors.TEXT_MUTED,
         ).pack()
         
         ctk.CTkLabel(
             no_result_frame,
             text=f"未找到包含 \"{keyword}\" 的记录",
-            font=ctk.CTkFont(family="Segoe UI", size=16),
+            font=_font(16, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
         ).pack(pady=(15, 5))
         
         ctk.CTkLabel(
             no_result_frame,
             text="尝试使用不同的关键词搜索",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             text_color=Colors.TEXT_MUTED,
         ).pack()
             
@@ -1114,49 +1539,21 @@ class EchoLogApp(ctk.CTk):
         page = ctk.CTkFrame(self._content_area, fg_color=Colors.CONTENT_BG)
         
         # Title
-        title_frame = ctk.CTkFrame(page, fg_color="transparent", height=60)
-        title_frame.pack(fill="x", padx=30, pady=(30, 20))
-        
-        ctk.CTkLabel(
-            title_frame,
-            text="设置",
-            font=ctk.CTkFont(family="Segoe UI", size=24, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(side="left")
+        self._make_title(page, "设置")
         
         # Settings cards
         settings_scroll = ctk.CTkScrollableFrame(page, fg_color="transparent")
         settings_scroll.pack(fill="both", expand=True, padx=30, pady=(0, 20))
         
         # Storage path setting
-        path_card = ctk.CTkFrame(settings_scroll, fg_color=Colors.CONTENT_CARD, corner_radius=16, border_width=1, border_color=Colors.CONTENT_BORDER)
-        path_card.pack(fill="x", pady=5)
-        
-        path_inner = ctk.CTkFrame(path_card, fg_color="transparent")
-        path_inner.pack(fill="x", padx=20, pady=15)
-        
-        path_left = ctk.CTkFrame(path_inner, fg_color="transparent")
-        path_left.pack(side="left", fill="x", expand=True)
-        
-        ctk.CTkLabel(
-            path_left,
-            text="📁 存储路径",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(anchor="w")
-        
-        self._path_display = ctk.CTkLabel(
-            path_left,
-            text=str(OutputConfig.OUTPUT_DIR),
-            font=ctk.CTkFont(family="Segoe UI", size=12),
-            text_color=Colors.TEXT_SECONDARY,
+        path_inner, self._path_display = self._make_setting_card(
+            settings_scroll, "📁 存储路径", str(OutputConfig.OUTPUT_DIR)
         )
-        self._path_display.pack(anchor="w", pady=(3, 0))
         
         ctk.CTkButton(
             path_inner,
             text="更改",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             width=70,
             height=32,
             corner_radius=16,
@@ -1166,28 +1563,9 @@ class EchoLogApp(ctk.CTk):
         ).pack(side="right")
         
         # Model selection
-        model_card = ctk.CTkFrame(settings_scroll, fg_color=Colors.CONTENT_CARD, corner_radius=16, border_width=1, border_color=Colors.CONTENT_BORDER)
-        model_card.pack(fill="x", pady=5)
-        
-        model_inner = ctk.CTkFrame(model_card, fg_color="transparent")
-        model_inner.pack(fill="x", padx=20, pady=15)
-        
-        model_left = ctk.CTkFrame(model_inner, fg_color="transparent")
-        model_left.pack(side="left", fill="x", expand=True)
-        
-        ctk.CTkLabel(
-            model_left,
-            text="🤖 识别模型",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(anchor="w")
-        
-        ctk.CTkLabel(
-            model_left,
-            text="选择 Deepgram 语音识别模型",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
-            text_color=Colors.TEXT_SECONDARY,
-        ).pack(anchor="w", pady=(3, 0))
+        model_inner, _ = self._make_setting_card(
+            settings_scroll, "🤖 识别模型", "选择 Deepgram 语音识别模型"
+        )
         
         # Model dropdown
         model_options = ["nova-2", "nova", "enhanced", "base"]
@@ -1196,7 +1574,7 @@ class EchoLogApp(ctk.CTk):
             model_inner,
             values=model_options,
             variable=self._model_var,
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             width=120,
             height=32,
             corner_radius=8,
@@ -1211,28 +1589,9 @@ class EchoLogApp(ctk.CTk):
         self._model_dropdown.pack(side="right", padx=(10, 0))
         
         # Language selection
-        lang_card = ctk.CTkFrame(settings_scroll, fg_color=Colors.CONTENT_CARD, corner_radius=16, border_width=1, border_color=Colors.CONTENT_BORDER)
-        lang_card.pack(fill="x", pady=5)
-        
-        lang_inner = ctk.CTkFrame(lang_card, fg_color="transparent")
-        lang_inner.pack(fill="x", padx=20, pady=15)
-        
-        lang_left = ctk.CTkFrame(lang_inner, fg_color="transparent")
-        lang_left.pack(side="left", fill="x", expand=True)
-        
-        ctk.CTkLabel(
-            lang_left,
-            text="🌐 识别语言",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(anchor="w")
-        
-        ctk.CTkLabel(
-            lang_left,
-            text="选择语音识别的目标语言",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
-            text_color=Colors.TEXT_SECONDARY,
-        ).pack(anchor="w", pady=(3, 0))
+        lang_inner, _ = self._make_setting_card(
+            settings_scroll, "🌐 识别语言", "选择语音识别的目标语言"
+        )
         
         # Language dropdown
         lang_options = ["zh (中文)", "en (英文)", "ja (日语)", "ko (韩语)", "multi (多语言)"]
@@ -1242,7 +1601,7 @@ class EchoLogApp(ctk.CTk):
             lang_inner,
             values=lang_options,
             variable=self._lang_var,
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             width=120,
             height=32,
             corner_radius=8,
@@ -1257,28 +1616,9 @@ class EchoLogApp(ctk.CTk):
         self._lang_dropdown.pack(side="right", padx=(10, 0))
         
         # Timestamp setting
-        timestamp_card = ctk.CTkFrame(settings_scroll, fg_color=Colors.CONTENT_CARD, corner_radius=16, border_width=1, border_color=Colors.CONTENT_BORDER)
-        timestamp_card.pack(fill="x", pady=5)
-        
-        timestamp_inner = ctk.CTkFrame(timestamp_card, fg_color="transparent")
-        timestamp_inner.pack(fill="x", padx=20, pady=15)
-        
-        timestamp_left = ctk.CTkFrame(timestamp_inner, fg_color="transparent")
-        timestamp_left.pack(side="left", fill="x", expand=True)
-        
-        ctk.CTkLabel(
-            timestamp_left,
-            text="⏱️ 显示时间戳",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
-            text_color=Colors.TEXT_PRIMARY,
-        ).pack(anchor="w")
-        
-        ctk.CTkLabel(
-            timestamp_left,
-            text="在每条记录前显示时间",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
-            text_color=Colors.TEXT_SECONDARY,
-        ).pack(anchor="w", pady=(3, 0))
+        timestamp_inner, _ = self._make_setting_card(
+            settings_scroll, "⏱️ 显示时间戳", "在每条记录前显示时间"
+        )
         
         self._timestamp_switch = ctk.CTkSwitch(
             timestamp_inner,
@@ -1302,14 +1642,14 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             feishu_header,
             text="🔗 飞书集成",
-            font=ctk.CTkFont(family="Segoe UI", size=16, weight="bold"),
+            font=_font(16, "bold", family="Segoe UI"),
             text_color=Colors.TEXT_PRIMARY,
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             feishu_header,
             text="将每日工作记录同步到飞书多维表格和云文档",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
         ).pack(anchor="w", pady=(3, 0))
         
@@ -1321,7 +1661,7 @@ class EchoLogApp(ctk.CTk):
         self._sync_daily_btn = ctk.CTkButton(
             feishu_buttons,
             text="📅 同步今日日报",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color=Colors.ACCENT,
             hover_color=Colors.ACCENT_HOVER,
             corner_radius=8,
@@ -1334,7 +1674,7 @@ class EchoLogApp(ctk.CTk):
         self._sync_weekly_btn = ctk.CTkButton(
             feishu_buttons,
             text="📊 同步周报",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color="#10B981",
             hover_color="#059669",
             corner_radius=8,
@@ -1347,7 +1687,7 @@ class EchoLogApp(ctk.CTk):
         self._open_bitable_btn = ctk.CTkButton(
             feishu_buttons,
             text="📋 打开多维表格",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color=Colors.TEXT_SECONDARY,
             hover_color=Colors.SIDEBAR_ACTIVE,
             corner_radius=8,
@@ -1360,7 +1700,7 @@ class EchoLogApp(ctk.CTk):
         self._feishu_status = ctk.CTkLabel(
             feishu_card,
             text="状态：未同步",
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=_font(11, family="Segoe UI"),
             text_color=Colors.TEXT_MUTED,
         )
         self._feishu_status.pack(anchor="w", padx=20, pady=(0, 15))
@@ -1376,14 +1716,14 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             notion_header,
             text="📓 Notion 集成",
-            font=ctk.CTkFont(family="Segoe UI", size=16, weight="bold"),
+            font=_font(16, "bold", family="Segoe UI"),
             text_color=Colors.TEXT_PRIMARY,
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             notion_header,
             text="将每日工作记录同步到 Notion 数据库",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
         ).pack(anchor="w", pady=(3, 0))
         
@@ -1394,7 +1734,7 @@ class EchoLogApp(ctk.CTk):
         self._sync_notion_btn = ctk.CTkButton(
             notion_buttons,
             text="📅 同步日报到 Notion",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color=Colors.ACCENT,
             hover_color=Colors.ACCENT_HOVER,
             corner_radius=8,
@@ -1406,7 +1746,7 @@ class EchoLogApp(ctk.CTk):
         self._sync_notion_weekly_btn = ctk.CTkButton(
             notion_buttons,
             text="📊 同步周报到 Notion",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color="#10B981", 
             hover_color="#059669",
             corner_radius=8,
@@ -1418,7 +1758,7 @@ class EchoLogApp(ctk.CTk):
         self._open_notion_btn = ctk.CTkButton(
             notion_buttons,
             text="🔗 打开页面",
-            font=ctk.CTkFont(family="Segoe UI", size=13),
+            font=_font(13, family="Segoe UI"),
             fg_color=Colors.TEXT_SECONDARY,
             hover_color=Colors.SIDEBAR_ACTIVE,
             corner_radius=8,
@@ -1431,7 +1771,7 @@ class EchoLogApp(ctk.CTk):
         self._notion_status = ctk.CTkLabel(
             notion_card,
             text="状态：未同步",
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=_font(11, family="Segoe UI"),
             text_color=Colors.TEXT_MUTED,
         )
         self._notion_status.pack(anchor="w", padx=20, pady=(0, 15))
@@ -1447,14 +1787,14 @@ class EchoLogApp(ctk.CTk):
         ctk.CTkLabel(
             about_inner,
             text="关于 EchoLog",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+            font=_font(14, "bold", family="Segoe UI"),
             text_color=Colors.TEXT_PRIMARY,
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             about_inner,
             text="版本 1.0.0 | 桌面智能听写助手\n利用 Deepgram API 实现高精度实时语音转文字",
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=_font(12, family="Segoe UI"),
             text_color=Colors.TEXT_SECONDARY,
             justify="left",
         ).pack(anchor="w", pady=(5, 0))
@@ -1477,17 +1817,23 @@ class EchoLogApp(ctk.CTk):
     def _toggle_timestamp(self):
         """Toggle timestamp display"""
         OutputConfig.INCLUDE_TIMESTAMPS = self._timestamp_switch.get() == 1
-        
+        # A running engine formats file lines from its own copy of the setting
+        engine = self._engine
+        if engine is not None:
+            engine._snapshot_output_config()
+        
+    # Display names for Deepgram language codes
+    _LANG_NAMES = {
+        "zh": "中文",
+        "en": "英文",
+        "ja": "日语",
+        "ko": "韩语",
+        "multi": "多语言",
+    }
+    
     def _get_lang_name(self, lang_code: str) -> str:
         """Get language name from code"""
-        lang_map = {
-            "zh": "中文",
-            "en": "英文",
-            "ja": "日语",
-            "ko": "韩语",
-            "multi": "多语言",
-        }
-        return lang_map.get(lang_code, lang_code)
+        return self._LANG_NAMES.get(lang_code, lang_code)
         
     def _on_model_change(self, choice: str):
         """Handle model selection change"""
@@ -1507,6 +1853,13 @@ class EchoLogApp(ctk.CTk):
         
     def _show_page(self, page_name: str):
         """Show a specific page"""
+        # Already showing: skip the hide / re-pack, but still pick up history changes
+        if (page_name == self._current_page and page_name in self._pages
+                and self._pages[page_name].winfo_ismapped()):
+            if page_name == "history" and self._history_needs_refresh():
+                self._refresh_history()
+            return
+            
         # Hide all pages
         for page in self._pages.values():
             page.pack_forget()
@@ -1515,13 +1868,17 @@ class EchoLogApp(ctk.CTk):
         for name, item in self._nav_items.items():
             item.set_active(name == page_name)
             
+        # Build the page lazily on first navigation
+        if page_name not in self._pages and page_name in self._page_factories:
+            self._pages[page_name] = self._page_factories[page_name]()
+            
         # Show selected page
         if page_name in self._pages:
             self._pages[page_name].pack(fill="both", expand=True)
             self._current_page = page_name
             
-            # Refresh history when showing
-            if page_name == "history":
+            # Refresh history when showing, unless nothing changed
+            if page_name == "history" and self._history_needs_refresh():
                 self._refresh_history()
                 
     # ========================================
@@ -1550,14 +1907,14 @@ class EchoLogApp(ctk.CTk):
             return
             
         # Update UI
-        self._record_btn.configure(
+        self._home.record_btn.configure(
             text="🎙️ 录音中...",
             fg_color=Colors.RECORDING,
             hover_color=Colors.RECORDING_HOVER,
             state="disabled",
         )
-        self._pause_btn.configure(state="normal")
-        self._stop_btn.configure(state="normal")
+        self._home.pause_btn.configure(state="normal")
+        self._home.stop_btn.configure(state="normal")
         
         self._is_recording = True
         self._is_paused = False
@@ -1569,17 +1926,14 @@ class EchoLogApp(ctk.CTk):
         self._current_interim_text = ""
         
         # Add start message
-        self._text_display.configure(state="normal")
-        self._text_display.delete("1.0", "end")
-        self._text_display.configure(state="disabled")
+        self._home.text_display.delete("1.0", "end")
         
         timestamp = datetime.now().strftime("%H:%M:%S")
         self._append_text(f"🔴 开始录音 [{timestamp}]\n\n", "system")
         
-        # Start async engine
-        self._async_loop = asyncio.new_event_loop()
-        self._async_thread = threading.Thread(target=self._run_async_engine, daemon=True)
-        self._async_thread.start()
+        # Start async engine on the shared loop
+        self._ensure_async_loop()
+        self._session = asyncio.run_coroutine_threadsafe(self._run_session(), self._async_loop)
         
     def _pause_recording(self):
         """Pause the current recording"""
@@ -1587,10 +1941,11 @@ class EchoLogApp(ctk.CTk):
             return
             
         self._is_paused = True
+        self._signal_resume(False)
         
         # Update UI
-        self._pause_btn.configure(text="▶️ 继续")
-        self._record_btn.configure(
+        self._home.pause_btn.configure(text="▶️ 继续")
+        self._home.record_btn.configure(
             text="⏸️ 已暂停",
             fg_color=Colors.PAUSED,
             hover_color=Colors.WARNING,
@@ -1607,10 +1962,11 @@ class EchoLogApp(ctk.CTk):
             return
             
         self._is_paused = False
+        self._signal_resume(True)
         
         # Update UI
-        self._pause_btn.configure(text="⏸️ 暂停")
-        self._record_btn.configure(
+        self._home.pause_btn.configure(text="⏸️ 暂停")
+        self._home.record_btn.configure(
             text="🎙️ 录音中...",
             fg_color=Colors.RECORDING,
             hover_color=Colors.RECORDING_HOVER,
@@ -1621,6 +1977,16 @@ class EchoLogApp(ctk.CTk):
         timestamp = datetime.now().strftime("%H:%M:%S")
         self._append_text(f"▶️ 继续录音 [{timestamp}]\n\n", "system")
         
+    def _signal_resume(self, resumed: bool):
+        """Set or clear the sender's resume event from the Tk thread"""
+        loop, event = self._async_loop, self._resume_event
+        if loop is None or event is None:
+            return  # _run_engine creates the event from _is_paused
+        try:
+            loop.call_soon_threadsafe(event.set if resumed else event.clear)
+        except RuntimeError:
+            pass  # Loop already closed
+            
     def _stop_recording(self):
         """Stop the recording session"""
         if not self._is_recording:
@@ -1636,19 +2002,23 @@ class EchoLogApp(ctk.CTk):
                 self._async_loop
             )
             
-        # Wait for thread
-        if self._async_thread and self._async_thread.is_alive():
-            self._async_thread.join(timeout=5)
+        # Wait for the session to wind down (the loop itself keeps running)
+        if self._session is not None:
+            try:
+                self._session.result(timeout=5)
+            except Exception:
+                pass  # Timed out or failed; errors were already reported
+            self._session = None
             
         # Update UI
-        self._record_btn.configure(
+        self._home.record_btn.configure(
             text="🎙️ 开始录音",
             fg_color=Colors.ACCENT,
             hover_color=Colors.ACCENT_HOVER,
             state="normal",
         )
-        self._pause_btn.configure(text="⏸️ 暂停", state="disabled")
-        self._stop_btn.configure(state="disabled")
+        self._home.pause_btn.configure(text="⏸️ 暂停", state="disabled")
+        self._home.stop_btn.configure(state="disabled")
         
         # Clear interim and add end message
         self._clear_interim_text()
@@ -1657,9 +2027,45 @@ class EchoLogApp(ctk.CTk):
         
         self._update_status("idle")
         
-    def _run_async_engine(self):
-        """Run the transcription engine in background thread"""
-        asyncio.set_event_loop(self._async_loop)
+    def _ensure_async_loop(self):
+        """Start the engine's event loop thread on first use; it is reused
+        by every later recording session"""
+        if self._async_loop is not None:
+            return
+        from audio_engine import new_event_loop
+        self._async_loop = new_event_loop()
+        self._async_thread = threading.Thread(
+            target=self._run_async_loop, args=(self._async_loop,),
+            name="echolog-engine", daemon=True,
+        )
+        self._async_thread.start()
+        
+    @staticmethod
+    def _run_async_loop(loop: asyncio.AbstractEventLoop):
+        """Run the engine loop in the background thread until stopped"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            
+    def _shutdown_async_loop(self):
+        """Stop the engine loop and wait briefly for its thread"""
+        loop, thread = self._async_loop, self._async_thread
+        if loop is None:
+            return
+        self._async_loop = None
+        self._async_thread = None
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+        except RuntimeError:
+            pass  # Already closed
+        if thread is not None:
+            thread.join(timeout=1)
+            
+    async def _run_session(self):
+        """Run one recording session on the shared engine loop"""
+        from audio_engine import TranscriptionEngine
         
         self._engine = TranscriptionEngine(
             on_interim=self._handle_interim,
@@ -1668,16 +2074,24 @@ class EchoLogApp(ctk.CTk):
             on_status_change=self._update_status,
         )
         
+        # The engine appends through the handle the header was written with
         self._engine._output_file = self._output_file
+        self._engine._output_fp, self._output_fp = self._output_fp, None
         
         try:
-            self._async_loop.run_until_complete(self._run_engine())
+            await self._run_engine()
         except Exception as e:
             self._handle_error(e)
         finally:
-            self._async_loop.close()
-            self._async_loop = None
+            # stop() skips cleanup when the engine never started running
+            self._engine._shutdown_writer()
+            self._engine._close_output_file()
+            self._resume_event = None
             self._engine = None
+            # The engine ended on its own (connect or reconnect failed):
+            # bring the controls back to idle
+            if self._is_recording:
+                self.after(0, self._stop_recording)
             
     async def _run_engine(self):
         """Start and run the engine"""
@@ -1693,20 +2107,24 @@ class EchoLogApp(ctk.CTk):
         self._engine._is_running = True
         self._engine._on_status_change("recording")
         
-        while not self._engine._audio_queue.empty():
-            try:
-                self._engine._audio_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._engine._reset_audio_buffer()
+        
+        self._resume_event = asyncio.Event()
+        if not self._is_paused:
+            self._resume_event.set()
                 
         self._engine._tasks = [
             asyncio.create_task(self._engine._capture_audio()),
             asyncio.create_task(self._send_audio_with_pause()),
             asyncio.create_task(self._engine._receive_transcription()),
+            asyncio.create_task(self._engine._keep_alive()),
         ]
         
-        while self._engine._is_running and self._is_recording:
-            await asyncio.sleep(0.1)
+        # Wait for engine.stop() (scheduled by _stop_recording) instead of
+        # polling; _is_recording is cleared before that stop is scheduled,
+        # so a stop that raced the connect is caught here
+        if self._is_recording:
+            await self._engine._stop_event.wait()
             
         await self._engine.stop()
         
@@ -1714,24 +2132,19 @@ class EchoLogApp(ctk.CTk):
         """Send audio with pause support"""
         while self._engine and self._engine._is_running:
             try:
-                # Skip sending when paused
-                if self._is_paused:
-                    await asyncio.sleep(0.1)
+                # Sleep while paused, then discard what the mic picked up
+                # meanwhile so it isn't coalesced into the first batch
+                if not self._resume_event.is_set():
+                    await self._resume_event.wait()
+                    self._engine._reset_audio_buffer()
                     continue
                     
-                audio_data = await asyncio.wait_for(
-                    self._engine._audio_queue.get(),
-                    timeout=0.5
-                )
+                # Buffered blocks come back coalesced into one send
+                audio_data = await self._engine._next_audio()
                 
-                if self._engine._websocket and not self._is_paused:
-                    try:
-                        await self._engine._websocket.send(audio_data)
-                    except:
-                        break
+                if audio_data and not self._is_paused:
+                    await self._engine._send_chunk(audio_data)
                         
-            except asyncio.TimeoutError:
-                continue
             except Exception:
                 break
                 
@@ -1743,44 +2156,55 @@ class EchoLogApp(ctk.CTk):
         """Handle interim result"""
         if self._is_paused:
             return
-        self.after(0, lambda: self._update_interim_text(f"💭 {text}"))
+        # Bursts of partials collapse into one textbox update per flush
+        self._pending_interim = f"💭 {text}"
+        if not self._interim_flush_scheduled:
+            self._interim_flush_scheduled = True
+            self.after(GUIConfig.INTERIM_FLUSH_MS, self._flush_interim_text)
         
     def _handle_final(self, text: str):
         """Handle final result"""
         if self._is_paused:
             return
             
-        self.after(0, self._clear_interim_text)
-        
-        timestamp = datetime.now().strftime(OutputConfig.CONTENT_TIME_FORMAT)
-        
-        if OutputConfig.INCLUDE_TIMESTAMPS:
-            self.after(0, lambda: self._append_text(f"{timestamp} ", "timestamp"))
-            self.after(0, lambda: self._append_text(f"{text}\n\n", "final"))
-        else:
-            self.after(0, lambda: self._append_text(f"{text}\n\n", "final"))
+        # Drop any partial still waiting to be drawn
+        self._pending_interim = None
+        
+        # Formatted at most once per second; the engine is already loaded
+        # whenever finals arrive
+        from audio_engine import content_timestamp
+        timestamp = content_timestamp(OutputConfig.CONTENT_TIME_FORMAT)
+        stamp = f"{timestamp} " if OutputConfig.INCLUDE_TIMESTAMPS else None
+        # One Tk callback per final instead of one per text piece
+        self.after(0, self._commit_final, f"{text}\n\n", stamp)
             
         self._write_to_file(text, timestamp)
         
     def _handle_error(self, error: Exception):
         """Handle error"""
-        self.after(0, lambda: self._append_text(f"\n⚠️ 错误: {error}\n", "system"))
-        
+        self.after(0, self._append_text, f"\n⚠️ 错误: {error}\n", "system")
+        
+    # Indicator text and dot color for each engine status
+    _STATUS_DISPLAY = {
+        "idle": ("就绪", Colors.SUCCESS),
+        "connecting": ("连接中...", Colors.WARNING),
+        "recording": ("录音中", Colors.RECORDING),
+        "paused": ("已暂停", Colors.PAUSED),
+        "stopping": ("停止中...", Colors.WARNING),
+        "error": ("错误", Colors.ERROR),
+    }
+    _STATUS_UNKNOWN = ("未知", Colors.TEXT_MUTED)
+    
     def _update_status(self, status: str):
         """Update status indicator"""
-        status_map = {
-            "idle": ("就绪", Colors.SUCCESS),
-            "connecting": ("连接中...", Colors.WARNING),
-            "recording": ("录音中", Colors.RECORDING),
-            "paused": ("已暂停", Colors.PAUSED),
-            "stopping": ("停止中...", Colors.WARNING),
-            "error": ("错误", Colors.ERROR),
-        }
-        
-        text, color = status_map.get(status, ("未知", Colors.TEXT_MUTED))
+        text, color = self._STATUS_DISPLAY.get(status, self._STATUS_UNKNOWN)
+        self.after(0, self._apply_status, text, color)
         
-        self.after(0, lambda: self._status_dot.configure(text_color=color))
-        self.after(0, lambda: self._status_label.configure(text=text))
+    def _apply_status(self, text: str, color: str):
+        """Apply a status update to the indicator (Tk thread)"""
+        home = self._home
+        home.status_dot.configure(text_color=color)
+        home.status_label.configure(text=text)
         
     # ========================================
     # Text Display
@@ -1788,51 +2212,59 @@ class EchoLogApp(ctk.CTk):
     
     def _append_text(self, text: str, tag: str = "final"):
         """Append text with tag"""
-        self._text_display.configure(state="normal")
-        self._text_display.insert("end", text, tag)
-        self._text_display.configure(state="disabled")
-        self._text_display.see("end")
+        td = self._home.text_display
+        td.insert("end", text, tag)
+        self._request_autoscroll()
+        
+    def _commit_final(self, text: str, stamp: Optional[str] = None):
+        """Replace the interim line with a final result and its timestamp"""
+        self._clear_interim_text()
+        td = self._home.text_display
+        if stamp:
+            td.insert("end", stamp, "timestamp")
+        td.insert("end", text, "final")
+        self._request_autoscroll()
+        
+    def _request_autoscroll(self):
+        """Scroll to the end once for any number of writes in an interval"""
+        if not self._autoscroll_pending:
+            self._autoscroll_pending = True
+            self.after(GUIConfig.AUTOSCROLL_MS, self._do_autoscroll)
+            
+    def _do_autoscroll(self):
+        self._autoscroll_pending = False
+        self._home.text_display.see("end")
         
+    def _remove_interim_range(self):
+        """Delete the interim line between its tracking marks"""
+        self._home.text_display.delete("interim_start", "interim_end")
+            
     def _update_interim_text(self, text: str):
         """Update interim text"""
-        self._text_display.configure(state="normal")
-        
         if self._current_interim_text:
-            try:
-                start_idx = self._text_display.search(
-                    self._current_interim_text,
-                    "end-2c",
-                    backwards=True,
-                    exact=True
-                )
-                if start_idx:
-                    end_idx = f"{start_idx}+{len(self._current_interim_text)}c"
-                    self._text_display.delete(start_idx, end_idx)
-            except:
-                pass
+            self._remove_interim_range()
                 
         self._current_interim_text = text
-        self._text_display.insert("end", text, "interim")
-        self._text_display.configure(state="disabled")
-        self._text_display.see("end")
+        td = self._home.text_display
+        td.mark_set("interim_start", "end-1c")
+        td.insert("end", text, "interim")
+        td.mark_set("interim_end", "end-1c")
+        self._request_autoscroll()
+        
+    def _flush_interim_text(self):
+        """Draw the latest pending interim partial, if any"""
+        # Clear the flag before reading so a partial arriving meanwhile
+        # schedules another flush
+        self._interim_flush_scheduled = False
+        text = self._pending_interim
+        if text is None or not self._is_recording or self._is_paused:
+            return
+        self._update_interim_text(text)
         
     def _clear_interim_text(self):
         """Clear interim text"""
         if self._current_interim_text:
-            self._text_display.configure(state="normal")
-            try:
-                start_idx = self._text_display.search(
-                    self._current_interim_text,
-                    "end-2c",
-                    backwards=True,
-                    exact=True
-                )
-                if start_idx:
-                    end_idx = f"{start_idx}+{len(self._current_interim_text)}c"
-                    self._text_display.delete(start_idx, end_idx)
-            except:
-                pass
-            self._text_display.configure(state="disabled")
+            self._remove_interim_range()
         self._current_interim_text = ""
         
     # ========================================
@@ -1847,27 +2279,29 @@ class EchoLogApp(ctk.CTk):
         filename = f"{OutputConfig.FILE_PREFIX}_{timestamp}{OutputConfig.FILE_EXTENSION}"
         filepath = OutputConfig.OUTPUT_DIR / filename
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"# EchoLog 听写记录\n")
-            f.write(f"> 创建时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            
+        header = OutputConfig.HEADER_TEMPLATE.format(
+            created=datetime.now().strftime(OutputConfig.HEADER_TIME_FORMAT)
+        )
+        # Same binary, pre-encoded layout the engine appends with
+        f = open(filepath, "wb", buffering=65536)
+        f.write(header.encode("utf-8"))
+        f.flush()
+        
+        self._output_fp = f
         self._output_file = str(filepath)
-        self._file_indicator.configure(text=f"📄 {filename}")
+        self._home.file_indicator.configure(text=f"📄 {filename}")
         
     def _write_to_file(self, text: str, timestamp: str):
-        """Write to output file"""
-        if not self._output_file:
+        """Queue an append to the output file on the engine's writer thread"""
+        engine = self._engine
+        if not self._output_file or engine is None:
             return
             
-        try:
-            with open(self._output_file, "a", encoding="utf-8") as f:
-                if OutputConfig.INCLUDE_TIMESTAMPS:
-                    f.write(f"{timestamp} {text}\n\n")
-                else:
-                    f.write(f"{text}\n\n")
-        except Exception as e:
-            self.after(0, lambda: self._handle_error(e))
+        # Appends don't touch the directory mtime, so flag the list directly
+        self._history_dirty = True
+        # The engine keeps the file open for the session and reports write
+        # errors through _handle_error; stop() drains the queue
+        engine._submit_write(text, timestamp)
             
     def _open_output_folder(self):
         """Open the output folder in explorer"""
@@ -1898,9 +2332,9 @@ class EchoLogApp(ctk.CTk):
                 result = service.sync_daily_report()
                 
                 # 更新 UI
-                self.after(0, lambda: self._handle_sync_result(result, "日报"))
+                self.after(0, self._handle_sync_result, result, "日报")
             except Exception as e:
-                self.after(0, lambda: self._handle_sync_error(str(e)))
+                self.after(0, self._handle_sync_error, str(e))
         
         threading.Thread(target=do_sync, daemon=True).start()
     
@@ -1915,9 +2349,9 @@ class EchoLogApp(ctk.CTk):
                 service = get_feishu_sync_service()
                 result = service.sync_weekly_report()
                 
-                self.after(0, lambda: self._handle_sync_result(result, "周报"))
+                self.after(0, self._handle_sync_result, result, "周报")
             except Exception as e:
-                self.after(0, lambda: self._handle_sync_error(str(e)))
+                self.after(0, self._handle_sync_error, str(e))
         
         threading.Thread(target=do_sync, daemon=True).start()
     
@@ -1992,7 +2426,7 @@ class EchoLogApp(ctk.CTk):
                 data = summary_service.aggregate_daily_content(datetime.now())
                 
                 if not data["contents"]:
-                     self.after(0, lambda: self._handle_notion_sync_result({"success": False, "error": "今日暂无记录"}))
+                     self.after(0, self._handle_notion_sync_result, {"success": False, "error": "今日暂无记录"})
                      return
 
                 # Merge content
@@ -2032,10 +2466,10 @@ class EchoLogApp(ctk.CTk):
                 service = NotionSyncService()
                 url = service.sync_daily_report(report_data)
                 
-                self.after(0, lambda: self._handle_notion_sync_result({"success": True, "url": url}))
+                self.after(0, self._handle_notion_sync_result, {"success": True, "url": url})
                 
             except Exception as e:
-                 self.after(0, lambda: self._handle_notion_sync_result({"success": False, "error": str(e)}))
+                 self.after(0, self._handle_notion_sync_result, {"success": False, "error": str(e)})
         
         threading.Thread(target=do_sync, daemon=True).start()
 
@@ -2053,7 +2487,7 @@ class EchoLogApp(ctk.CTk):
                 data = summary_service.aggregate_weekly_content(datetime.now())
                 
                 if not data["contents"]:
-                     self.after(0, lambda: self._handle_notion_sync_result({"success": False, "error": "本周暂无记录"}))
+                     self.after(0, self._handle_notion_sync_result, {"success": False, "error": "本周暂无记录"})
                      return
 
                 # Merge content
@@ -2097,10 +2531,10 @@ class EchoLogApp(ctk.CTk):
                 service = NotionSyncService()
                 url = service.sync_daily_report(report_data) # Reuse same method for creating page
                 
-                self.after(0, lambda: self._handle_notion_sync_result({"success": True, "url": url}))
+                self.after(0, self._handle_notion_sync_result, {"success": True, "url": url})
                 
             except Exception as e:
-                 self.after(0, lambda: self._handle_notion_sync_result({"success": False, "error": str(e)}))
+                 self.after(0, self._handle_notion_sync_result, {"success": False, "error": str(e)})
         
         threading.Thread(target=do_sync, daemon=True).start()
 
@@ -2149,6 +2583,7 @@ class EchoLogApp(ctk.CTk):
         """Handle window close"""
         if self._is_recording:
             self._stop_recording()
+        self._shutdown_async_loop()
         self.destroy()
         sys.exit(0)
 
@@ -6,63 +6,45 @@ Notion Block Generators
 
 from typing import List, Dict, Any, Optional
 
+# 无内容块（如分割线）共用的空 body，只读，序列化时不会被修改
+_EMPTY_BODY: Dict[str, Any] = {}
+
+# Callout 图标按 emoji 共用同一个（只读）dict
+_EMOJI_ICONS: Dict[str, Dict[str, str]] = {}
+
+
+def _text_block(block_type: str, text: str) -> Dict[str, Any]:
+    """创建只包含 rich_text 的块"""
+    return {"object": "block", "type": block_type, block_type: {"rich_text": BlockBuilder.rich_text(text)}}
+
+
 class BlockBuilder:
     """Notion Block 构建器"""
     
     @staticmethod
     def paragraph(text: str) -> Dict[str, Any]:
         """创建段落块"""
-        return {
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": BlockBuilder.rich_text(text)
-            }
-        }
+        return _text_block("paragraph", text)
         
     @staticmethod
     def heading_1(text: str) -> Dict[str, Any]:
         """创建一级标题"""
-        return {
-            "object": "block",
-            "type": "heading_1",
-            "heading_1": {
-                "rich_text": BlockBuilder.rich_text(text)
-            }
-        }
+        return _text_block("heading_1", text)
         
     @staticmethod
     def heading_2(text: str) -> Dict[str, Any]:
         """创建二级标题"""
-        return {
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": BlockBuilder.rich_text(text)
-            }
-        }
+        return _text_block("heading_2", text)
         
     @staticmethod
     def heading_3(text: str) -> Dict[str, Any]:
         """创建三级标题"""
-        return {
-            "object": "block",
-            "type": "heading_3",
-            "heading_3": {
-                "rich_text": BlockBuilder.rich_text(text)
-            }
-        }
+        return _text_block("heading_3", text)
         
     @staticmethod
     def bulleted_list_item(text: str) -> Dict[str, Any]:
         """创建无序列表项"""
-        return {
-            "object": "block",
-            "type": "bulleted_list_item",
-            "bulleted_list_item": {
-                "rich_text": BlockBuilder.rich_text(text)
-            }
-        }
+        return _text_block("bulleted_list_item", text)
         
     @staticmethod
     def to_do(text: str, checked: bool = False) -> Dict[str, Any]:
@@ -84,22 +66,14 @@ class BlockBuilder:
             "type": "callout",
             "callout": {
                 "rich_text": BlockBuilder.rich_text(text),
-                "icon": {
-                    "emoji": emoji
-                }
+                "icon": _EMOJI_ICONS.get(emoji) or _EMOJI_ICONS.setdefault(emoji, {"emoji": emoji})
             }
         }
         
     @staticmethod
     def quote(text: str) -> Dict[str, Any]:
         """创建引用块"""
-        return {
-            "object": "block",
-            "type": "quote",
-            "quote": {
-                "rich_text": BlockBuilder.rich_text(text)
-            }
-        }
+        return _text_block("quote", text)
         
     @staticmethod
     def divider() -> Dict[str, Any]:
@@ -107,7 +81,7 @@ class BlockBuilder:
         return {
             "object": "block",
             "type": "divider",
-            "divider": {}
+            "divider": _EMPTY_BODY
         }
         
     @staticmethod
@@ -116,14 +90,6 @@ class BlockBuilder:
         if not content:
             return []
             
-        text_obj = {
-            "type": "text",
-            "text": {
-                "content": content
-            }
-        }
-        
         if link:
-            text_obj["text"]["link"] = {"url": link}
-            
-        return [text_obj]
+            return [{"type": "text", "text": {"content": content, "link": {"url": link}}}]
+        return [{"type": "text", "text": {"content": content}}]
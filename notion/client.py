@@ -6,18 +6,43 @@ Notion API Client Wrapper
 
 import os
 import logging
-from typing import Optional
-from notion_client import Client
-from dotenv import load_dotenv
+import importlib.util
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+# notion_client / httpx / dotenv 在首次使用时才导入，避免拖慢 GUI 冷启动
+if TYPE_CHECKING:
+    import httpx
+    from notion_client import Client
+
+_env_loaded = False
+
+
+def load_env():
+    """加载 .env 中的环境变量（进程内只读取一次）"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
 
-# 加载环境变量
-load_dotenv()
 
 class NotionClient:
     """Notion API 客户端包装器 (单例模式)"""
     
     _instance: Optional['NotionClient'] = None
-    _client: Optional[Client] = None
+    _client: Optional['Client'] = None
+    _http_client: Optional['httpx.Client'] = None
+    
+    # 所有 Notion 服务共用的连接池参数
+    POOL_MAX_CONNECTIONS = 20
+    POOL_KEEPALIVE_EXPIRY = 30.0
+    
+    # 连接测试结果的缓存时间（秒）
+    PROBE_TTL = 30.0
+    _last_probe: Optional[tuple] = None  # (monotonic 时间, 结果)
+    _probe_thread: Optional[threading.Thread] = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -32,6 +57,7 @@ class NotionClient:
             
     def _init_client(self):
         """从环境变量初始化 notion-client"""
+        load_env()
         api_key = os.getenv("NOTION_API_KEY")
         
         if not api_key:
@@ -39,14 +65,33 @@ class NotionClient:
             return
             
         try:
-            self._client = Client(auth=api_key)
+            import httpx
+            from notion_client import Client
+            
+            # 进程内共享一个持久连接池，避免每次请求重新握手 TCP + TLS
+            # HTTP/2 需要可选依赖 h2，未安装时使用 HTTP/1.1 keep-alive
+            limits = httpx.Limits(
+                max_keepalive_connections=self.POOL_MAX_CONNECTIONS,
+                max_connections=self.POOL_MAX_CONNECTIONS,
+                keepalive_expiry=self.POOL_KEEPALIVE_EXPIRY,
+            )
+            http2 = importlib.util.find_spec("h2") is not None
+            self._http_client = httpx.Client(http2=http2, limits=limits)
+            self._client = Client(auth=api_key, client=self._http_client)
             self._logger.info("Notion 客户端初始化成功")
         except Exception as e:
             self._logger.error(f"Notion 客户端初始化失败: {e}")
             self._client = None
+    
+    def close(self):
+        """关闭共享的 HTTP 连接池"""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+            self._client = None
 
     @property
-    def client(self) -> Optional[Client]:
+    def client(self) -> Optional['Client']:
         """获取原始 notion-client 实例"""
         return self._client
         
@@ -55,19 +100,39 @@ class NotionClient:
         """检查连接状态"""
         return self._client is not None
         
-    def test_connection(self) -> bool:
-        """测试 API 连接有效性"""
+    def test_connection(self, force: bool = False) -> bool:
+        """
+        测试 API 连接有效性
+        
+        结果缓存 PROBE_TTL 秒；缓存过期时立即返回上次结果，
+        并在后台线程重新探测。首次调用或 force=True 时同步探测。
+        """
         if not self.is_connected:
             return False
+        
+        last = self._last_probe
+        if force or last is None:
+            return self._probe()
+        
+        if time.monotonic() - last[0] >= self.PROBE_TTL:
+            if self._probe_thread is None or not self._probe_thread.is_alive():
+                self._probe_thread = threading.Thread(target=self._probe, daemon=True)
+                self._probe_thread.start()
+        return last[1]
+    
+    def _probe(self) -> bool:
+        """调用 users.me() 检查连接，并记录结果"""
         try:
             self._client.users.me()
-            return True
+            ok = True
         except Exception as e:
             self._logger.error(f"Notion 连接测试失败: {e}")
-            return False
+            ok = False
+        self._last_probe = (time.monotonic(), ok)
+        return ok
 
 # 全局单例获取函数
-def get_notion_client() -> Optional[Client]:
+def get_notion_client() -> Optional['Client']:
     """获取全局 Notion Client 实例 (快捷方式)"""
     wrapper = NotionClient()
     return wrapper.client
@@ -5,12 +5,19 @@ Notion Database Service
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from .client import get_notion_client
 
+# Database 元数据缓存：database_id -> (获取时间, 元数据)，进程内所有实例共享
+_DB_INFO_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 class NotionDatabase:
     """Notion Database 管理服务"""
     
+    # Database 结构很少变化，元数据缓存有效期（秒）
+    DB_INFO_TTL = 300
+    
     def __init__(self):
         self.client = get_notion_client()
         self.logger = logging.getLogger("EchoLog.NotionDB")
@@ -21,31 +28,56 @@ class NotionDatabase:
         filter_criteria: Optional[Dict[str, Any]] = None,
         sorts: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
-        """查询 Database"""
+        """查询 Database（自动翻页，返回全部结果）"""
         
         if not self.client:
             return []
             
         try:
-            payload = {"database_id": database_id}
+            results: List[Dict[str, Any]] = []
+            payload = {"database_id": database_id, "page_size": 100}
             if filter_criteria:
                 payload["filter"] = filter_criteria
             if sorts:
                 payload["sorts"] = sorts
-                
-            response = self.client.databases.query(**payload)
-            return response.get("results", [])
+            
+            # 每页最多 100 条，下一页的 cursor 只能从上一页的响应中获得
+            while True:
+                response = self.client.databases.query(**payload)
+                results.extend(response.get("results", []))
+                next_cursor = response.get("next_cursor")
+                if not response.get("has_more") or not next_cursor:
+                    break
+                payload["start_cursor"] = next_cursor
+            return results
             
         except Exception as e:
+            # 中途某页失败时不返回已取到的部分结果，避免被当成完整结果集
             self.logger.error(f"查询 Database 失败: {e}")
             return []
 
     def get_database_info(self, database_id: str) -> Optional[Dict[str, Any]]:
-        """获取 Database 元数据"""
+        """获取 Database 元数据（按 database_id 缓存 DB_INFO_TTL 秒）"""
         if not self.client:
             return None
+        
+        cached = _DB_INFO_CACHE.get(database_id)
+        if cached and time.monotonic() - cached[0] < self.DB_INFO_TTL:
+            return cached[1]
+        
         try:
-            return self.client.databases.retrieve(database_id=database_id)
+            info = self.client.databases.retrieve(database_id=database_id)
         except Exception as e:
             self.logger.error(f"获取 Database 信息失败: {e}")
             return None
+        
+        _DB_INFO_CACHE[database_id] = (time.monotonic(), info)
+        return info
+    
+    @staticmethod
+    def invalidate(database_id: Optional[str] = None):
+        """清除指定 Database（默认全部）的元数据缓存，修改结构后调用"""
+        if database_id is None:
+            _DB_INFO_CACHE.clear()
+        else:
+            _DB_INFO_CACHE.pop(database_id, None)
@@ -5,13 +5,35 @@ Notion Page Service
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from .client import get_notion_client
 from .blocks import BlockBuilder
 
+# Notion API 单次请求最多接受 100 个 children
+_NOTION_MAX_CHILDREN = 100
+# 单个 rich_text 内容最多 2000 字符，超出部分会被 API 拒绝
+_NOTION_MAX_TEXT = 2000
+
+
+def _chunk(seq: List[Any], n: int = _NOTION_MAX_CHILDREN) -> List[List[Any]]:
+    """按 n 个一组切分列表"""
+    return [seq[i : i + n] for i in range(0, len(seq), n)]
+
+
+def _paragraph_blocks(text: str) -> List[Dict[str, Any]]:
+    """将一段文本转为段落块，超过 _NOTION_MAX_TEXT 的部分拆成多个段落"""
+    return [BlockBuilder.paragraph(text[i : i + _NOTION_MAX_TEXT]) for i in range(0, len(text), _NOTION_MAX_TEXT)]
+
+
 class NotionPageService:
     """Notion 页面管理服务"""
     
+    # 追加 blocks 遇到限流 / 网关错误时的重试次数和初始退避（秒）
+    APPEND_RETRIES = 3
+    APPEND_BACKOFF = 1.0
+    RETRY_STATUSES = (429, 502, 503, 504)
+    
     def __init__(self):
         self.client = get_notion_client()
         self.logger = logging.getLogger("EchoLog.NotionPage")
@@ -23,40 +45,73 @@ class NotionPageService:
         children: Optional[List[Dict[str, Any]]] = None
     ) -> Optional[Dict[str, Any]]:
         """在指定 Database 中创建新页面"""
+        payload, remaining = self.build_page_payload(database_id, properties, children)
+        return self.send_page_payload(payload, remaining)
+    
+    def build_page_payload(
+        self,
+        database_id: str,
+        properties: Dict[str, Any],
+        children: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[Dict[str, Any], List[List[Dict[str, Any]]]]:
+        """
+        构建 pages.create 的请求参数
         
-        if not self.client:
-            self.logger.error("Notion 客户端未连接")
-            return None
-            
+        Returns:
+            (payload, 剩余需要分批追加的 block 批次)
+            调用方可以只替换 payload["properties"] 后重新发送，无需重新切分 children
+        """
         payload = {
             "parent": {"database_id": database_id},
             "properties": properties,
         }
             
-        if children:
-            # Notion API 限制每次最多 100 个 block
-            # 如果超过限制，需要分批追加（这里先简单处理前100个，实际场景可能需要优化）
-            payload["children"] = children[:100]
-            
+        # Notion API 限制每次最多 100 个 block：第一批随页面创建，其余分批追加
+        chunks = _chunk(children or [])
+        if chunks:
+            payload["children"] = chunks[0]
+        return payload, chunks[1:]
+    
+    def send_page_payload(
+        self,
+        payload: Dict[str, Any],
+        remaining: Optional[List[List[Dict[str, Any]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """发送 build_page_payload 构建的页面，并追加剩余的 block 批次"""
+        if not self.client:
+            self.logger.error("Notion 客户端未连接")
+            return None
+        
         response = self.client.pages.create(**payload)
         self.logger.info(f"成功创建页面: {response['id']}")
         
-        # 如果还有剩余的 block，分批追加
-        if children and len(children) > 100:
-            self._append_remaining_blocks(response['id'], children[100:])
+        if remaining:
+            self._append_remaining_blocks(response['id'], remaining)
             
         return response
 
-    def _append_remaining_blocks(self, block_id: str, blocks: List[Dict[str, Any]]):
-        """分批追加剩余的 blocks"""
-        batch_size = 100
-        for i in range(0, len(blocks), batch_size):
-            batch = blocks[i : i + batch_size]
+    def _append_remaining_blocks(self, block_id: str, batches: List[List[Dict[str, Any]]]):
+        """按顺序追加剩余的 block 批次（每批不超过 _NOTION_MAX_CHILDREN 个）"""
+        for n, batch in enumerate(batches):
+            i = (n + 1) * _NOTION_MAX_CHILDREN
             try:
-                self.client.blocks.children.append(block_id=block_id, children=batch)
+                self._append_with_retry(block_id, batch)
                 self.logger.info(f"追加 {len(batch)} 个 blocks 从索引 {i}")
             except Exception as e:
-                self.logger.error(f"追加 blocks 失败: {e}")
+                self.logger.error(f"追加 blocks 失败 (索引 {i}): {e}")
+    
+    def _append_with_retry(self, block_id: str, batch: List[Dict[str, Any]]):
+        """追加一批 blocks，限流 (429) 或网关错误时指数退避重试"""
+        delay = self.APPEND_BACKOFF
+        for attempt in range(self.APPEND_RETRIES + 1):
+            try:
+                return self.client.blocks.children.append(block_id=block_id, children=batch)
+            except Exception as e:
+                if getattr(e, "status", None) not in self.RETRY_STATUSES or attempt == self.APPEND_RETRIES:
+                    raise
+                self.logger.warning(f"追加 blocks 被限流/失败 ({e})，{delay:.1f}s 后重试")
+                time.sleep(delay)
+                delay *= 2
 
     def construct_page_content(self, ai_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -68,28 +123,25 @@ class NotionPageService:
         # 1. 摘要部分 (Callout)
         if ai_data.get('summary'):
             blocks.append(BlockBuilder.heading_2("📝 此刻摘要"))
-            blocks.append(BlockBuilder.paragraph(ai_data['summary']))
+            blocks.extend(_paragraph_blocks(ai_data['summary']))
             blocks.append(BlockBuilder.divider())
 
         # 2. 待办事项 (To-Do List)
         if ai_data.get('action_items'):
             blocks.append(BlockBuilder.heading_2("✅ 待办事项"))
-            for item in ai_data['action_items']:
-                blocks.append(BlockBuilder.to_do(item))
+            blocks.extend(BlockBuilder.to_do(item) for item in ai_data['action_items'])
             blocks.append(BlockBuilder.divider())
 
         # 3. 灵感与想法 (Bullet List)
         if ai_data.get('inspirations'):
             blocks.append(BlockBuilder.heading_2("💡 灵感与想法"))
-            for item in ai_data['inspirations']:
-                blocks.append(BlockBuilder.bulleted_list_item(item))
+            blocks.extend(BlockBuilder.bulleted_list_item(item) for item in ai_data['inspirations'])
             blocks.append(BlockBuilder.divider())
 
         # 4. 风险提示 (Callout - Red/Warning)
         if ai_data.get('risks'):
             blocks.append(BlockBuilder.heading_2("⚠️ 风险提示"))
-            for item in ai_data['risks']:
-                blocks.append(BlockBuilder.callout(item, "⚠️"))
+            blocks.extend(BlockBuilder.callout(item, "⚠️") for item in ai_data['risks'])
             blocks.append(BlockBuilder.divider())
             
         # 5. 原始内容/大纲
@@ -97,9 +149,10 @@ class NotionPageService:
             blocks.append(BlockBuilder.heading_2("📄 原始内容"))
             # 简单处理：将内容作为段落，或者按行分割
             # 更好的做法是如果 content 是长文本，按段落分割
-            paragraphs = ai_data['content'].split('\n\n')
-            for p in paragraphs:
-                if p.strip():
-                    blocks.append(BlockBuilder.paragraph(p.strip()))
+            # 按空行分段；单段超长时拆分，避免超过 rich_text 长度限制
+            for p in ai_data['content'].split('\n\n'):
+                p = p.strip()
+                if p:
+                    blocks.extend(_paragraph_blocks(p))
                     
         return blocks
@@ -8,18 +8,16 @@ import os
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
 
+from .client import load_env
 from .pages import NotionPageService
 
-# 加载环境变量
-load_dotenv()
-
 class NotionSyncService:
     """Notion 同步服务"""
     
     def __init__(self):
         self.logger = logging.getLogger("EchoLog.NotionSync")
+        load_env()
         self.page_service = NotionPageService()
         self.database_id = os.getenv("NOTION_DATABASE_ID")
         
@@ -35,19 +33,26 @@ class NotionSyncService:
             
         self.logger.info("开始同步数据到 Notion...")
         
+        # 只取一次当前时间，保证标题、Date 属性和元数据块一致（跨零点同步时也不会错开）
+        now = datetime.now()
+        date_str = now.strftime('%Y-%m-%d')
+        datetime_str = now.strftime('%Y-%m-%d %H:%M')
+        
         # 1. 准备 Database Properties
-        keywords = report_data.get("keywords", [])
+        keywords = report_data.get("keywords", []) or []
+        keywords_str = ', '.join(keywords)
         action_items = report_data.get("action_items", [])
+        report_type = report_data.get("type", "日报")
         
         properties = {
             "Name": {
-                "title": [{"text": {"content": report_data.get("title", f"EchoLog Report {datetime.now().strftime('%Y-%m-%d')}")}}]
+                "title": [{"text": {"content": report_data.get("title", f"EchoLog Report {date_str}")}}]
             },
             "Date": {
-                "date": {"start": datetime.now().strftime('%Y-%m-%d')}
+                "date": {"start": date_str}
             },
             "Type": {
-                "select": {"name": report_data.get("type", "日报")}
+                "select": {"name": report_type}
             },
             "Summary": {
                 "rich_text": [{"text": {"content": report_data.get("summary", "")[:2000]}}]  # Notion limit
@@ -70,11 +75,9 @@ class NotionSyncService:
                 "object": "block",
                 "type": "callout",
                 "callout": {
-                    "rich_text": [
-                        {"type": "text", "text": {"content": f"📅 日期: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"}},
-                        {"type": "text", "text": {"content": f"🏷️ 类型: {report_data.get('type', '日报')}\n"}}, 
-                        {"type": "text", "text": {"content": f"📌 关键词: {', '.join(report_data.get('keywords', []))}"}}
-                    ],
+                    "rich_text": [{"type": "text", "text": {
+                        "content": f"📅 日期: {datetime_str}\n🏷️ 类型: {report_type}\n📌 关键词: {keywords_str}"
+                    }}],
                     "icon": {"emoji": "ℹ️"},
                     "color": "gray_background"
                 }
@@ -86,7 +89,7 @@ class NotionSyncService:
         ai_data = {
             "summary": report_data.get("summary", ""),
             "content": report_data.get("text", ""),
-            "action_items": report_data.get("action_items", []),
+            "action_items": action_items,
             "inspirations": report_data.get("inspirations", []),
             "risks": report_data.get("risks", [])
         }
@@ -95,13 +98,14 @@ class NotionSyncService:
         # 合并 Blocks
         all_blocks = metadata_blocks + content_blocks
         
-        # 3. 创建页面
+        # 3. 创建页面（payload 只构建一次，属性回退时只替换 properties）
+        payload, remaining = self.page_service.build_page_payload(
+            database_id=self.database_id,
+            properties=properties,
+            children=all_blocks
+        )
         try:
-            result = self.page_service.create_page_in_database(
-                database_id=self.database_id,
-                properties=properties,
-                children=all_blocks
-            )
+            result = self.page_service.send_page_payload(payload, remaining)
         except Exception as e:
             error_msg = str(e)
             if "property that exists" in error_msg or "validation" in error_msg.lower():
@@ -116,11 +120,8 @@ class NotionSyncService:
                     })
                 }
                 
-                result = self.page_service.create_page_in_database(
-                    database_id=self.database_id,
-                    properties=minimal_properties,
-                    children=all_blocks
-                )
+                payload["properties"] = minimal_properties
+                result = self.page_service.send_page_payload(payload, remaining)
             else:
                 raise e
         
@@ -7,8 +7,11 @@ Windows-specific GUI implementation with proper font and path handling.
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Make the project root importable when this file is run directly; skip
+# it when already reachable (e.g. launched from the root or via -m)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 # Import and run main app
 from main_gui import main
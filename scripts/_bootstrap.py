@@ -0,0 +1,14 @@
+"""
+脚本共用的路径初始化
+====================
+导入时把项目根目录加入 sys.path（已存在则不重复添加），
+脚本之后即可直接导入 config / feishu / notion 等顶层模块。
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
@@ -0,0 +1,17 @@
+"""
+脚本共用的 .env 加载
+====================
+load_env() 在每个进程内只解析一次项目根目录的 .env，
+脚本之间互相导入或串联执行时不再重复读取。
+"""
+
+from functools import lru_cache
+
+from _bootstrap import PROJECT_ROOT
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """加载项目根目录的 .env（每个进程只执行一次）"""
+    from dotenv import load_dotenv
+    load_dotenv(PROJECT_ROOT / ".env")
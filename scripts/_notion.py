@@ -0,0 +1,43 @@
+"""
+脚本共用的 Notion 客户端
+========================
+导入时加载一次项目根目录的 .env；client() 返回进程内唯一的 Client，
+多个脚本串联或互相导入时复用同一个连接池。
+"""
+
+import importlib.util
+import json
+import os
+from typing import Optional
+
+import httpx
+from notion_client import Client
+
+from _env import load_env
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to stdlib
+    orjson = None
+
+load_env()
+
+_client: Optional[Client] = None
+
+
+def client() -> Client:
+    """返回共享的 Notion Client（首次调用时创建）"""
+    global _client
+    if _client is None:
+        # 与 notion.NotionClient 相同：装了 h2 时走 HTTP/2，多个请求复用一条连接
+        http2 = importlib.util.find_spec("h2") is not None
+        http_client = httpx.Client(http2=http2, limits=httpx.Limits(max_connections=20, max_keepalive_connections=10))
+        _client = Client(auth=os.getenv("NOTION_API_KEY"), client=http_client)
+    return _client
+
+
+def dumps_pretty(obj) -> str:
+    """把 Notion 返回的 JSON 格式化为带缩进的字符串（调试打印用）"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
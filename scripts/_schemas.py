@@ -0,0 +1,58 @@
+"""
+Notion 日报 Database 的属性结构
+===============================
+fix_db_props / force_update_db / init_notion_database 共用，只在此处维护。
+需要增减属性时用 {**DAILY_REPORT_PROPERTIES, ...} 组合，不要原地修改。
+ensure_schema() 补齐缺失属性，只发一次 databases.update。
+"""
+
+DAILY_REPORT_PROPERTIES = {
+    'Date': {'date': {}},
+    'Summary': {'rich_text': {}},
+    'Content': {'rich_text': {}},
+    'Todo Count': {'number': {'format': 'number'}},
+    'Keywords': {
+        'multi_select': {
+            'options': [
+                {'name': '会议', 'color': 'blue'},
+                {'name': '待办', 'color': 'red'},
+                {'name': '灵感', 'color': 'yellow'},
+                {'name': '风险', 'color': 'orange'},
+                {'name': '笔记', 'color': 'green'},
+            ]
+        }
+    },
+    'Type': {
+        'select': {
+            'options': [
+                {'name': '日报', 'color': 'blue'},
+                {'name': '周报', 'color': 'purple'},
+                {'name': '月报', 'color': 'pink'},
+            ]
+        }
+    },
+    'Status': {
+        'select': {
+            'options': [
+                {'name': '待处理', 'color': 'yellow'},
+                {'name': '已处理', 'color': 'green'},
+            ]
+        }
+    },
+    'Page Link': {'url': {}},
+}
+
+
+def ensure_schema(notion, database_id, properties=None) -> dict:
+    """读取一次当前结构，把缺失的属性合并到一次 databases.update 中补齐
+
+    properties 默认为 DAILY_REPORT_PROPERTIES；返回本次新增的属性（无缺失时为空 dict）。
+    """
+    if properties is None:
+        properties = DAILY_REPORT_PROPERTIES
+    db = notion.databases.retrieve(database_id)
+    current = db.get('properties') or {}
+    missing = {name: prop for name, prop in properties.items() if name not in current}
+    if missing:
+        notion.databases.update(database_id=database_id, properties=missing)
+    return missing
@@ -1,11 +1,8 @@
 """逐个添加属性"""
-from notion_client import Client
+from _notion import client
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-notion = Client(auth=os.getenv('NOTION_API_KEY'))
+notion = client()
 DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
 
 properties_to_add = {
@@ -42,13 +39,29 @@ properties_to_add = {
 
 print(f"正在向 {DATABASE_ID} 添加属性...")
 
-for name, config in properties_to_add.items():
-    print(f"尝试添加 [{name}]...", end="")
-    try:
-        notion.databases.update(
-            database_id=DATABASE_ID,
-            properties={name: config}
-        )
-        print(" ✅ 成功")
-    except Exception as e:
-        print(f" ❌ 失败: {e}")
+# 先一次请求提交全部属性；失败时再逐个添加，定位出错的属性
+try:
+    db = notion.databases.update(
+        database_id=DATABASE_ID,
+        properties=properties_to_add
+    )
+except Exception as e:
+    print(f"批量添加失败 ({e})，改为逐个添加")
+    db = None
+
+if db is not None:
+    for name in properties_to_add:
+        status = "✅ 成功" if name in db.get('properties', {}) else "❌ 未出现在返回结果中"
+        print(f"[{name}] {status}")
+else:
+    # 逐个顺序请求：对同一 Database 并发改结构会返回 409 / 429，错误会被算到别的属性头上
+    for name, config in properties_to_add.items():
+        print(f"尝试添加 [{name}]...", end="")
+        try:
+            notion.databases.update(
+                database_id=DATABASE_ID,
+                properties={name: config}
+            )
+            print(" ✅ 成功")
+        except Exception as e:
+            print(f" ❌ 失败: {e}")
@@ -1,12 +1,7 @@
 """查看 Data Source 属性"""
-from notion_client import Client
-import os
-import json
-from dotenv import load_dotenv
+from _notion import client, dumps_pretty
 
-load_dotenv()
-
-notion = Client(auth=os.getenv('NOTION_API_KEY'))
+notion = client()
 
 # 查看 data source 属性
 try:
@@ -22,6 +17,6 @@ try:
         print('  (没有属性)')
     print()
     print('完整结构:')
-    print(json.dumps(ds, indent=2, ensure_ascii=False, default=str))
+    print(dumps_pretty(ds))
 except Exception as e:
     print(f'Error: {e}')
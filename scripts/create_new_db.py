@@ -1,15 +1,7 @@
 
 import os
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
-from notion_client import Client
-
-# Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
-
-load_dotenv(project_root / ".env")
+from _notion import client as notion_client, dumps_pretty
 
 api_key = os.getenv("NOTION_API_KEY")
 parent_page_id = os.getenv("NOTION_PARENT_PAGE_ID")
@@ -24,7 +16,7 @@ if not parent_page_id:
     # For now, just exit.
     sys.exit(1)
 
-client = Client(auth=api_key)
+client = notion_client()
 
 print(f"Creating new Daily Report Database under page: {parent_page_id}")
 
@@ -65,9 +57,8 @@ try:
         }
     )
     
-    import json
     print("DEBUG: Create Response:")
-    print(json.dumps(new_db, indent=2, default=str))
+    print(dumps_pretty(new_db))
     
     new_db_id = new_db["id"]
     print(f"\n✅ Successfully created new database!")
@@ -1,11 +1,9 @@
 """更新 Notion Database 属性 (从 .env 读取 ID)"""
-from notion_client import Client
+from _notion import client
+from _schemas import DAILY_REPORT_PROPERTIES
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-notion = Client(auth=os.getenv('NOTION_API_KEY'))
+notion = client()
 DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
 
 print(f"正在更新 Database: {DATABASE_ID}")
@@ -17,47 +15,12 @@ try:
     
     # 2. 如果只有默认属性，进行重命名
     # 默认的 Title 属性通常叫 "Name" 或 "标题"
-    current_title_prop = None
-    for name, prop in db['properties'].items():
-        if prop['type'] == 'title':
-            current_title_prop = name
-            break
+    current_title_prop = next(
+        (name for name, prop in db['properties'].items() if prop['type'] == 'title'),
+        None
+    )
             
-    properties_payload = {
-        'Date': {'date': {}},
-        'Summary': {'rich_text': {}},
-        'Content': {'rich_text': {}},
-        'Todo Count': {'number': {'format': 'number'}},
-        'Keywords': {
-            'multi_select': {
-                'options': [
-                    {'name': '会议', 'color': 'blue'},
-                    {'name': '待办', 'color': 'red'},
-                    {'name': '灵感', 'color': 'yellow'},
-                    {'name': '风险', 'color': 'orange'},
-                    {'name': '笔记', 'color': 'green'},
-                ]
-            }
-        },
-        'Type': {
-            'select': {
-                'options': [
-                    {'name': '日报', 'color': 'blue'},
-                    {'name': '周报', 'color': 'purple'},
-                    {'name': '月报', 'color': 'pink'},
-                ]
-            }
-        },
-        'Status': {
-            'select': {
-                'options': [
-                    {'name': '待处理', 'color': 'yellow'},
-                    {'name': '已处理', 'color': 'green'},
-                ]
-            }
-        },
-        'Page Link': {'url': {}},
-    }
+    properties_payload = dict(DAILY_REPORT_PROPERTIES)
     
     # 如果当前标题不是 'Title'，我们要重命名它
     if current_title_prop and current_title_prop != 'Title':
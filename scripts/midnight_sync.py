@@ -12,30 +12,63 @@ EchoLog 午夜自动同步脚本
 
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, time as dtime, timedelta
 from pathlib import Path
 
 # 添加项目根目录到 Python 路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from _bootstrap import PROJECT_ROOT
 
-# 加载环境变量
-from dotenv import load_dotenv
-load_dotenv(project_root / ".env")
+# 环境变量只在真正同步时加载，--install / --uninstall 不读取 .env
+from _env import load_env
+
+
+# 录音输出目录及扩展名（与 OutputConfig.OUTPUT_DIR / OutputConfig.is_recording_file 一致；
+# 这里不导入 config，避免在判断是否需要同步前就加载 .env）
+OUTPUT_DIR = PROJECT_ROOT / "output"
+RECORDING_EXTENSIONS = (".md", ".txt")
+
+# 日志分隔线
+SEP = "=" * 50
+
+
+def has_recordings(date: datetime) -> bool:
+    """输出目录中是否有当天修改的录音文件（只扫描一次目录，不导入 feishu / AI 模块）"""
+    day_start = datetime.combine(date.date(), dtime.min).timestamp()
+    day_end = datetime.combine(date.date() + timedelta(days=1), dtime.min).timestamp()
+    try:
+        with os.scandir(OUTPUT_DIR) as it:
+            for entry in it:
+                if not os.path.normcase(entry.name).endswith(RECORDING_EXTENSIONS):
+                    continue
+                try:
+                    if entry.is_file() and day_start <= entry.stat().st_mtime < day_end:
+                        return True
+                except OSError:
+                    continue
+    except OSError:
+        return False
+    return False
 
 
 def sync_yesterday():
     """同步昨天的日报"""
-    from feishu import get_feishu_sync_service
-    
     yesterday = datetime.now() - timedelta(days=1)
     
-    print(f"=" * 50)
+    print(SEP)
     print(f"EchoLog 午夜自动同步")
     print(f"执行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"同步日期: {yesterday.strftime('%Y-%m-%d')}")
-    print(f"=" * 50)
+    print(SEP)
+    
+    # 当天无录音（如周末）时直接跳过，不创建同步服务也不请求 AI / 飞书
+    if not has_recordings(yesterday):
+        print("\n⏭️ 当天无录音，跳过同步")
+        return True
     
+    load_env()
+    from feishu import get_feishu_sync_service
+    
+    service = None
     try:
         service = get_feishu_sync_service()
         result = service.sync_daily_report(yesterday, use_ai=True)
@@ -57,12 +90,83 @@ def sync_yesterday():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        # 等待后台写入的云文档内容完成，并释放线程池与连接池
+        if service is not None:
+            service.close()
+
+
+# Task Scheduler COM 常量
+TASK_TRIGGER_DAILY = 2
+TASK_ACTION_EXEC = 0
+TASK_CREATE_OR_UPDATE = 6
+TASK_LOGON_INTERACTIVE_TOKEN = 3
+TASK_RUNLEVEL_LUA = 0
+TASK_INSTANCES_IGNORE_NEW = 2
+
+
+def _task_scheduler_root():
+    """通过 COM 连接任务计划程序，返回 (scheduler, 根目录)；未安装 pywin32 时返回 None"""
+    try:
+        import win32com.client
+    except ImportError:
+        return None
+    scheduler = win32com.client.Dispatch("Schedule.Service")
+    scheduler.Connect()
+    return scheduler, scheduler.GetFolder("\\")
+
+
+def _register_task_com(scheduler, root, task_name, python_exe, script_path):
+    """用 COM 直接注册任务（同名任务会被覆盖），不再启动 schtasks 进程"""
+    td = scheduler.NewTask(0)
+    td.RegistrationInfo.Description = "EchoLog 午夜自动同步 - 每天 00:05 将前一天录音同步到飞书"
+    td.RegistrationInfo.Author = "EchoLog"
+    td.Principal.LogonType = TASK_LOGON_INTERACTIVE_TOKEN
+    td.Principal.RunLevel = TASK_RUNLEVEL_LUA
+    
+    settings = td.Settings
+    settings.MultipleInstances = TASK_INSTANCES_IGNORE_NEW
+    settings.DisallowStartIfOnBatteries = False
+    settings.StopIfGoingOnBatteries = False
+    settings.AllowHardTerminate = True
+    settings.StartWhenAvailable = True
+    settings.RunOnlyIfNetworkAvailable = True
+    settings.AllowDemandStart = True
+    settings.Enabled = True
+    settings.Hidden = False
+    settings.RunOnlyIfIdle = False
+    settings.WakeToRun = False
+    settings.ExecutionTimeLimit = "PT1H"
+    settings.Priority = 7
+    
+    trigger = td.Triggers.Create(TASK_TRIGGER_DAILY)
+    trigger.StartBoundary = "2026-01-01T00:05:00"
+    trigger.DaysInterval = 1
+    trigger.Enabled = True
+    
+    action = td.Actions.Create(TASK_ACTION_EXEC)
+    action.Path = python_exe
+    action.Arguments = f'"{script_path}"'
+    action.WorkingDirectory = str(PROJECT_ROOT)
+    
+    root.RegisterTaskDefinition(
+        task_name, td, TASK_CREATE_OR_UPDATE, "", "", TASK_LOGON_INTERACTIVE_TOKEN
+    )
+
+
+def _print_installed(task_name, script_path):
+    """打印安装成功提示"""
+    print(f"✅ Windows 任务计划已安装!")
+    print(f"   - 任务名称: {task_name}")
+    print(f"   - 执行时间: 每天 00:05")
+    print(f"   - 脚本路径: {script_path}")
+    print(f"\n💡 提示:")
+    print(f"   - 可在「任务计划程序」中查看和管理")
+    print(f"   - 运行 'python {script_path} --uninstall' 卸载")
 
 
 def install_task():
     """安装 Windows 任务计划"""
-    import subprocess
-    
     # 获取 Python 和脚本路径
     python_exe = sys.executable
     script_path = Path(__file__).resolve()
@@ -70,6 +174,19 @@ def install_task():
     # 任务名称
     task_name = "EchoLog_MidnightSync"
     
+    # 优先通过 COM 注册，未安装 pywin32 时回退到 schtasks + XML
+    try:
+        com = _task_scheduler_root()
+        if com is not None:
+            _register_task_com(*com, task_name, python_exe, script_path)
+            _print_installed(task_name, script_path)
+            return True
+    except Exception as e:
+        print(f"❌ 安装失败: {e}")
+        return False
+    
+    import subprocess
+    
     # 创建 XML 任务定义
     xml_content = f'''<?xml version="1.0" encoding="UTF-16"?>
 <Task version="1.4" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
@@ -111,13 +228,13 @@ def install_task():
     <Exec>
       <Command>{python_exe}</Command>
       <Arguments>"{script_path}"</Arguments>
-      <WorkingDirectory>{project_root}</WorkingDirectory>
+      <WorkingDirectory>{PROJECT_ROOT}</WorkingDirectory>
     </Exec>
   </Actions>
 </Task>'''
     
     # 保存 XML 文件
-    xml_path = project_root / "scripts" / "midnight_sync_task.xml"
+    xml_path = PROJECT_ROOT / "scripts" / "midnight_sync_task.xml"
     xml_path.write_text(xml_content, encoding="utf-16")
     
     # 注册任务
@@ -136,13 +253,7 @@ def install_task():
         )
         
         if result.returncode == 0:
-            print(f"✅ Windows 任务计划已安装!")
-            print(f"   - 任务名称: {task_name}")
-            print(f"   - 执行时间: 每天 00:05")
-            print(f"   - 脚本路径: {script_path}")
-            print(f"\n💡 提示:")
-            print(f"   - 可在「任务计划程序」中查看和管理")
-            print(f"   - 运行 'python {script_path} --uninstall' 卸载")
+            _print_installed(task_name, script_path)
             return True
         else:
             print(f"❌ 安装失败: {result.stderr}")
@@ -160,6 +271,13 @@ def uninstall_task():
     task_name = "EchoLog_MidnightSync"
     
     try:
+        com = _task_scheduler_root()
+        if com is not None:
+            _, root = com
+            root.DeleteTask(task_name, 0)
+            print(f"✅ Windows 任务计划已卸载: {task_name}")
+            return True
+        
         result = subprocess.run(
             ["schtasks", "/delete", "/tn", task_name, "/f"],
             capture_output=True,
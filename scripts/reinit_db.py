@@ -4,15 +4,12 @@
 创建包含完整属性配置的 Database，并更新 .env
 """
 
-from notion_client import Client
+from _notion import client
 import os
-import json
-from dotenv import load_dotenv
-
-load_dotenv()
+import tempfile
 
 # 初始化 Notion Client
-notion = Client(auth=os.getenv('NOTION_API_KEY'))
+notion = client()
 parent_page_id = os.getenv('NOTION_PARENT_PAGE_ID')
 
 print(f"Parent Page ID: {parent_page_id}")
@@ -73,20 +70,21 @@ try:
     # 3. 更新 .env
     env_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
     
-    # 读取原始内容
-    with open(env_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        
-    # 写入新内容
-    with open(env_path, 'w', encoding='utf-8') as f:
-        for line in lines:
+    # 逐行流式写入临时文件，再原子替换原文件
+    with open(env_path, 'r', encoding='utf-8') as src, tempfile.NamedTemporaryFile(
+        'w', delete=False, dir=os.path.dirname(env_path), encoding='utf-8'
+    ) as dst:
+        ends_with_newline = True
+        for line in src:
             if line.startswith('NOTION_DATABASE_ID='):
                 continue # 跳过旧配置
-            f.write(line)
+            dst.write(line)
+            ends_with_newline = line.endswith('\n')
         # 追加新配置
-        if not line.endswith('\n'):
-            f.write('\n')
-        f.write(f"NOTION_DATABASE_ID={new_db_id}\n")
+        if not ends_with_newline:
+            dst.write('\n')
+        dst.write(f"NOTION_DATABASE_ID={new_db_id}\n")
+    os.replace(dst.name, env_path)
         
     print("✅ .env 文件已更新")
 
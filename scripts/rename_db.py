@@ -1,20 +1,14 @@
 
 import os
-import sys
-from pathlib import Path
-from notion_client import Client
-from dotenv import load_dotenv
 
 # Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
+import _bootstrap
 
-load_dotenv(project_root / ".env")
+import _notion
 
-api_key = os.getenv("NOTION_API_KEY")
 db_id = os.getenv("NOTION_DATABASE_ID")
 
-client = Client(auth=api_key)
+client = _notion.client()
 
 new_title = "EchoLog Minutes"
 
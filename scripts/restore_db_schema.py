@@ -1,15 +1,11 @@
 
 import os
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
-from notion_client import Client
 
 # Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
+import _bootstrap
 
-load_dotenv(project_root / ".env")
+import _notion
 
 api_key = os.getenv("NOTION_API_KEY")
 db_id = os.getenv("NOTION_DATABASE_ID")
@@ -18,15 +14,27 @@ if not api_key or not db_id:
     print("❌ API Key or Database ID missing.")
     sys.exit(1)
 
-client = Client(auth=api_key)
+client = _notion.client()
 
-import json
+# 传入 --debug 时才打印完整的 Database JSON（大库序列化开销不小）
+DEBUG = "--debug" in sys.argv[1:]
+
+# 需要补齐的属性及其定义
+PROP_DEFINITIONS = {
+    "Date": {"date": {}},
+    "Type": {"select": {"options": [{"name": "日报", "color": "blue"}, {"name": "周报", "color": "purple"}]}},
+    "Summary": {"rich_text": {}},
+    "Keywords": {"multi_select": {"options": []}},
+    "Todo Count": {"number": {"format": "number"}},
+    "Status": {"select": {"options": [{"name": "已同步", "color": "green"}, {"name": "待同步", "color": "gray"}]}},
+}
 
 print(f"Checking Database: {db_id}")
 try:
     db = client.databases.retrieve(db_id)
-    print("DEBUG: Database Object:")
-    print(json.dumps(db, indent=2, default=str))
+    if DEBUG:
+        print("DEBUG: Database Object:")
+        print(_notion.dumps_pretty(db))
     
     current_props = db.get("properties", {})
     if current_props is None:
@@ -47,9 +55,6 @@ try:
         # But for safety, let's just proceed with adding other fields.
         pass
     
-    # ... (logic to define properties_to_update) ...
-    properties_to_update = {}
-    
     # Force Name if missing
     if not title_prop_name and "Name" not in current_props:
          # Note: You can't usually ADD a title property, you rename existing.
@@ -61,16 +66,11 @@ try:
     # Always add them if we can't see them (idempotent-ish if types match, but might error if exists with different type)
     # Safer to just try adding.
     
-    target_props = ["Date", "Type", "Summary", "Keywords", "Todo Count", "Status"]
-    
-    for prop in target_props:
-        if prop not in current_props:
-            if prop == "Date": properties_to_update["Date"] = {"date": {}}
-            if prop == "Type": properties_to_update["Type"] = {"select": {"options": [{"name": "日报", "color": "blue"}, {"name": "周报", "color": "purple"}]}}
-            if prop == "Summary": properties_to_update["Summary"] = {"rich_text": {}}
-            if prop == "Keywords": properties_to_update["Keywords"] = {"multi_select": {"options": []}}
-            if prop == "Todo Count": properties_to_update["Todo Count"] = {"number": {"format": "number"}}
-            if prop == "Status": properties_to_update["Status"] = {"select": {"options": [{"name": "已同步", "color": "green"}, {"name": "待同步", "color": "gray"}]}}
+    properties_to_update = {
+        prop: definition
+        for prop, definition in PROP_DEFINITIONS.items()
+        if prop not in current_props
+    }
 
     if properties_to_update:
         print(f"Updating database with properties: {list(properties_to_update.keys())}")
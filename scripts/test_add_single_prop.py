@@ -1,34 +1,22 @@
 
 import os
-import sys
-from pathlib import Path
-from dotenv import load_dotenv
-from notion_client import Client
 
 # Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
+import _bootstrap
 
-load_dotenv(project_root / ".env")
+import _notion
+from _schemas import ensure_schema
 
-api_key = os.getenv("NOTION_API_KEY")
 db_id = os.getenv("NOTION_DATABASE_ID")
 
-client = Client(auth=api_key)
+client = _notion.client()
 
 print(f"Target Database: {db_id}")
 
-# define property to add
-prop_name = "Date"
-prop_config = {"date": {}}
-
-print(f"Attempting to add property '{prop_name}'...")
+print("Adding missing properties in one update...")
 try:
-    client.databases.update(
-        database_id=db_id,
-        properties={prop_name: prop_config}
-    )
-    print("✅ Success!")
+    added = ensure_schema(client, db_id)
+    print(f"✅ Added: {list(added) or 'nothing, schema already complete'}")
 except Exception as e:
     print(f"❌ Failed: {e}")
 
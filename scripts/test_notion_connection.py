@@ -1,13 +1,12 @@
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
+import _bootstrap
 
-from dotenv import load_dotenv
-load_dotenv(project_root / ".env")
+from _env import load_env
+load_env()
 
 import logging
 logging.basicConfig(level=logging.INFO)
@@ -31,8 +30,12 @@ if not api_key:
 
 print("\nTesting Notion Client Connection...")
 try:
-    from notion_client import Client
-    client = Client(auth=api_key)
+    import _notion
+    client = _notion.client()
+    # The two checks are independent: fetch the database in the background
+    # while users.me() runs, so both requests are in flight at once
+    executor = ThreadPoolExecutor(max_workers=1)
+    db_future = executor.submit(client.databases.retrieve, database_id=db_id) if db_id else None
     me = client.users.me()
     print(f"✅ Successfully connected as: {me.get('name')} ({me.get('type')})")
 except Exception as e:
@@ -44,7 +47,7 @@ except Exception as e:
 print("\nTesting Database Access...")
 if db_id:
     try:
-        db = client.databases.retrieve(database_id=db_id)
+        db = db_future.result()
         print(f"✅ Database accessed: {db.get('title', [{}])[0].get('plain_text', 'Untitled')}")
         print("Database Properties Schema:")
         for name, prop in db.get('properties', {}).items():
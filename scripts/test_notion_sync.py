@@ -1,20 +1,17 @@
 
 import os
 import sys
-from pathlib import Path
 from datetime import datetime
 
-# Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
+from _bootstrap import PROJECT_ROOT
 
-from dotenv import load_dotenv
-load_dotenv(project_root / ".env")
+from _env import load_env
+load_env()
 
 import logging
 logging.basicConfig(level=logging.INFO)
 
-print("Project Root:", project_root)
+print("Project Root:", PROJECT_ROOT)
 
 try:
     from notion.sync import NotionSyncService
@@ -1,21 +1,15 @@
 
 import os
-import sys
-from pathlib import Path
 from datetime import datetime
-from notion_client import Client
 
 # Add project root to sys.path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.append(str(project_root))
+import _bootstrap
 
-from dotenv import load_dotenv
-load_dotenv(project_root / ".env")
+import _notion
 
-api_key = os.getenv("NOTION_API_KEY")
 db_id = os.getenv("NOTION_DATABASE_ID")
 
-client = Client(auth=api_key)
+client = _notion.client()
 
 print(f"Testing Minimal Sync to DB: {db_id}")
 
@@ -36,12 +30,7 @@ except Exception as e:
     
     # Try with lowercase 'title' or 'Title'?
     print("Trying 'Title' as key...")
-    properties2 = {
-        "title": { # Using ID 'title' is risky, usually it's name
-             "title": [{"text": {"content": "Minimal Sync Test 2"}}]
-        }
-    }
-    # actually keys in properties dict are names or IDs.
+    # Keys in the properties dict are property names or IDs.
     
     try:
         client.pages.create(
@@ -1,11 +1,8 @@
 """极简写入测试：使用默认属性名"""
-from notion_client import Client
+from _notion import client
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
-
-notion = Client(auth=os.getenv('NOTION_API_KEY'))
+notion = client()
 db_id = os.getenv('NOTION_DATABASE_ID')
 
 print(f"尝试向 Database {db_id} 写入...")
@@ -1,35 +1,21 @@
 """更新 Notion Database 属性"""
-from notion_client import Client
-import os
-from dotenv import load_dotenv
+from _notion import client
+from _schemas import ensure_schema
 
-load_dotenv()
-
-notion = Client(auth=os.getenv('NOTION_API_KEY'))
+notion = client()
 
 DATABASE_ID = '8193023c-4ed6-4ea9-a6c6-62de1a722244'
 
 print("正在更新 Database 属性...")
 
 try:
-    result = notion.databases.update(
-        database_id=DATABASE_ID,
-        properties={
-            'Date': {'date': {}},
-            'Summary': {'rich_text': {}},
-            'Content': {'rich_text': {}},
-            'Todo Count': {'number': {'format': 'number'}},
-            'Keywords': {'multi_select': {}},
-            'Type': {'select': {}},
-            'Status': {'select': {}},
-            'Page Link': {'url': {}},
-        }
-    )
+    added = ensure_schema(notion, DATABASE_ID)
     print("✅ 属性更新成功！")
-    print(f"返回结果类型: {type(result)}")
-    if isinstance(result, dict):
-        props = result.get('properties', {})
-        for name in props:
+    if added:
+        print("新增属性:")
+        for name in added:
             print(f"  - {name}")
+    else:
+        print("所有属性均已存在，无需更新")
 except Exception as e:
     print(f"❌ 更新失败: {e}")
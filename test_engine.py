@@ -8,16 +8,20 @@ Press Ctrl+C to stop recording.
 import asyncio
 import signal
 import sys
-from audio_engine import TranscriptionEngine
+from audio_engine import TranscriptionEngine, new_event_loop
 from config import DeepgramConfig, validate_config
 
+# Banner / section separators
+SEP = "=" * 60
+RULE = "-" * 60
+
 
 async def main():
     """Main test function."""
     
-    print("=" * 60)
+    print(SEP)
     print("  EchoLog 音频引擎测试")
-    print("=" * 60)
+    print(SEP)
     print()
     
     # Validate configuration
@@ -56,7 +60,7 @@ async def main():
         loop.add_signal_handler(signal.SIGINT, signal_handler)
     
     print("按 Ctrl+C 停止录音")
-    print("-" * 60)
+    print(RULE)
     print()
     
     # Start engine
@@ -76,13 +80,17 @@ async def main():
     await engine.stop()
     
     print()
-    print("=" * 60)
+    print(SEP)
     print("  测试结束")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == "__main__":
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
     try:
-        asyncio.run(main())
+        loop.run_until_complete(main())
     except KeyboardInterrupt:
         print("\n程序已退出")
+    finally:
+        loop.close()
@@ -2,12 +2,18 @@
 飞书 API 连接测试脚本
 =====================
 验证凭据并尝试操作多维表格
+
+使用方法：
+1. python test_feishu.py             # access_token 未过期时复用缓存
+2. python test_feishu.py --no-cache  # 强制重新认证，检查 APP_ID / APP_SECRET
 """
 
 import os
-import requests
+import sys
 from dotenv import load_dotenv
 
+from feishu.client import FeishuClient, create_session
+
 # 加载环境变量
 load_dotenv()
 
@@ -17,15 +23,36 @@ APP_SECRET = os.getenv("FEISHU_APP_SECRET")
 BITABLE_APP_TOKEN = os.getenv("FEISHU_BITABLE_APP_TOKEN")
 BITABLE_TABLE_ID = os.getenv("FEISHU_BITABLE_TABLE_ID")
 
+# 分隔线
+SEP = "=" * 50
+
+# 所有请求共用一个 Session（与 FeishuClient 相同的连接池和重试配置），复用 keep-alive 连接
+_SESSION = create_session()
 
-def get_tenant_access_token():
-    """获取 tenant_access_token"""
+
+def get_tenant_access_token(no_cache=False):
+    """获取 tenant_access_token
+    
+    默认通过 FeishuClient.access_token 获取，token 未过期时直接复用缓存；
+    no_cache 为 True 时跳过缓存直接请求认证接口，用于确认 APP_ID / APP_SECRET 本身有效。
+    """
+    if not no_cache and APP_ID and APP_SECRET:
+        try:
+            token = FeishuClient().access_token
+        except Exception as e:
+            print(f"❌ 获取 access_token 失败: {e}")
+            return None
+        print("✅ 获取 access_token 成功！")
+        print(f"   Token: {token[:20]}...")
+        print("   （未过期时复用缓存的 token，使用 --no-cache 强制重新认证）")
+        return token
+    
     url = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
     payload = {
         "app_id": APP_ID,
         "app_secret": APP_SECRET
     }
-    response = requests.post(url, json=payload)
+    response = _SESSION.post(url, json=payload)
     data = response.json()
     
     if data.get("code") == 0:
@@ -42,7 +69,7 @@ def get_bitable_meta(token):
     """获取多维表格元信息"""
     url = f"https://open.feishu.cn/open-apis/bitable/v1/apps/{BITABLE_APP_TOKEN}"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
     data = response.json()
     
     if data.get("code") == 0:
@@ -56,26 +83,36 @@ def get_bitable_meta(token):
         return False
 
 
+def print_fields(fields):
+    """打印字段列表"""
+    print(f"\n✅ 当前表格字段 ({len(fields)} 个):")
+    for field in fields:
+        print(f"   - {field['field_name']} ({field['type']})")
+
+
 def get_table_fields(token):
     """获取数据表字段"""
     url = f"https://open.feishu.cn/open-apis/bitable/v1/apps/{BITABLE_APP_TOKEN}/tables/{BITABLE_TABLE_ID}/fields"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
     data = response.json()
     
     if data.get("code") == 0:
         fields = data["data"]["items"]
-        print(f"\n✅ 当前表格字段 ({len(fields)} 个):")
-        for field in fields:
-            print(f"   - {field['field_name']} ({field['type']})")
+        print_fields(fields)
         return fields
     else:
         print(f"❌ 获取字段失败: {data}")
         return None
 
 
-def create_fields(token):
-    """创建 EchoLog 所需字段"""
+def create_fields(token, existing_fields=None):
+    """创建 EchoLog 所需字段
+    
+    existing_fields 为 get_table_fields 的结果时，已存在的字段不再请求。
+    同一数据表不支持并发写入，因此字段仍逐个创建。
+    返回新建字段的元信息（取自创建接口的响应，无需再查询一次）。
+    """
     url = f"https://open.feishu.cn/open-apis/bitable/v1/apps/{BITABLE_APP_TOKEN}/tables/{BITABLE_TABLE_ID}/fields"
     headers = {
         "Authorization": f"Bearer {token}",
@@ -142,14 +179,19 @@ def create_fields(token):
     
     print(f"\n📝 开始创建字段...")
     
-    created_count = 0
+    existing_names = {f["field_name"] for f in existing_fields or []}
+    created_fields = []
     for field in fields_to_create:
-        response = requests.post(url, headers=headers, json=field)
+        if field["field_name"] in existing_names:
+            print(f"   ⏭️ 字段已存在: {field['field_name']}")
+            continue
+        
+        response = _SESSION.post(url, headers=headers, json=field)
         data = response.json()
         
         if data.get("code") == 0:
             print(f"   ✅ 创建字段: {field['field_name']}")
-            created_count += 1
+            created_fields.append(data["data"]["field"])
         else:
             error_msg = data.get("msg", "未知错误")
             if "already exist" in error_msg.lower() or "1254007" in str(data.get("code")):
@@ -157,14 +199,14 @@ def create_fields(token):
             else:
                 print(f"   ❌ 创建失败: {field['field_name']} - {data}")
     
-    print(f"\n✅ 创建完成！新增 {created_count} 个字段")
-    return created_count
+    print(f"\n✅ 创建完成！新增 {len(created_fields)} 个字段")
+    return created_fields
 
 
 def main():
-    print("=" * 50)
+    print(SEP)
     print("飞书 API 连接测试")
-    print("=" * 50)
+    print(SEP)
     
     print(f"\n📋 配置信息:")
     print(f"   App ID: {APP_ID}")
@@ -172,47 +214,47 @@ def main():
     print(f"   Table ID: {BITABLE_TABLE_ID}")
     
     # 1. 获取 access_token
-    print(f"\n{'='*50}")
+    print(f"\n{SEP}")
     print("步骤 1: 获取 access_token")
-    print("=" * 50)
-    token = get_tenant_access_token()
+    print(SEP)
+    token = get_tenant_access_token(no_cache="--no-cache" in sys.argv[1:])
     if not token:
         return
     
     # 2. 获取多维表格信息
-    print(f"\n{'='*50}")
+    print(f"\n{SEP}")
     print("步骤 2: 验证多维表格访问权限")
-    print("=" * 50)
+    print(SEP)
     if not get_bitable_meta(token):
         print("\n⚠️ 可能需要在飞书开放平台配置应用权限")
         return
     
     # 3. 获取当前字段
-    print(f"\n{'='*50}")
+    print(f"\n{SEP}")
     print("步骤 3: 获取当前表格字段")
-    print("=" * 50)
+    print(SEP)
     fields = get_table_fields(token)
     
     # 4. 创建新字段
-    print(f"\n{'='*50}")
+    print(f"\n{SEP}")
     print("步骤 4: 创建 EchoLog 所需字段")
-    print("=" * 50)
+    print(SEP)
     
     user_input = input("\n是否创建新字段？(y/n): ")
     if user_input.lower() == 'y':
-        create_fields(token)
+        created_fields = create_fields(token, fields)
         
-        # 再次获取字段验证
-        print(f"\n{'='*50}")
-        print("验证: 获取更新后的字段")
-        print("=" * 50)
-        get_table_fields(token)
+        # 用创建接口返回的字段信息验证，不再重新拉取
+        print(f"\n{SEP}")
+        print("验证: 更新后的字段")
+        print(SEP)
+        print_fields((fields or []) + created_fields)
     else:
         print("跳过字段创建")
     
-    print(f"\n{'='*50}")
+    print(f"\n{SEP}")
     print("✅ 测试完成！")
-    print("=" * 50)
+    print(SEP)
 
 
 if __name__ == "__main__":